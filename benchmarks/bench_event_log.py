@@ -0,0 +1,70 @@
+"""
+이벤트 로그 벤치마크: 요청 경로 print vs event_log.emit
+
+    python -m benchmarks.bench_event_log [--n 50000] [--buffer 1000]
+
+- print: 기존처럼 stdout(여기서는 /dev/null 파일)로 동기 출력
+- emit: 링 버퍼 적재만 (백그라운드 스레드가 JSONL 로 배치 기록)
+- emit + 느린 저장소: 기록 1배치당 50ms 지연 → 버퍼가 차면 버려지고 dropped 로 집계
+건당 p50/p99(µs)와 기록/드롭 수를 출력한다. Clova 호출 없음.
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from services.event_log import EventLog, _JsonlSink
+
+RECORD = {
+    "doc_type": "license", "outcome": "valid",
+    "stage_ms": {"orientation": 812.4, "ocr": 640.1, "visualize": 35.2, "extract": 2.1},
+    "clova_calls": 4, "image_sha256": "ab" * 32, "total_ms": 1490.0,
+}
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1e6
+    return {"p50_us": round(pick(0.5), 2), "p99_us": round(pick(0.99), 2)}
+
+def _time_each(fn: Callable[[], None], n: int) -> List[float]:
+    out = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return out
+
+class _SlowSink(_JsonlSink):
+    def write(self, batch):
+        time.sleep(0.05)
+        super().write(batch)
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=50000)
+    ap.add_argument("--buffer", type=int, default=1000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d, open(os.devnull, "w") as devnull:
+        print_samples = _time_each(lambda: print(f"[🖼️ OCR 시각화 저장 완료] {RECORD}", file=devnull, flush=True), args.n)
+        print("print          ", _percentiles(print_samples))
+
+        log = EventLog(os.path.join(d, "events.jsonl"), buffer_size=args.buffer, batch_size=200, flush_sec=0.05)
+        emit_samples = _time_each(lambda: log.emit("verification", **RECORD), args.n)
+        log.close()
+        print("emit           ", _percentiles(emit_samples), log.status())
+
+        import services.event_log as mod
+        orig, mod._JsonlSink = mod._JsonlSink, _SlowSink
+        try:
+            slow = EventLog(os.path.join(d, "slow.jsonl"), buffer_size=args.buffer, batch_size=200, flush_sec=0.05)
+            slow_samples = _time_each(lambda: slow.emit("verification", **RECORD), args.n)
+            slow.close(timeout=30)
+        finally:
+            mod._JsonlSink = orig
+        print("emit(slow sink)", _percentiles(slow_samples), slow.status())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+키워드 근사 매칭 벤치마크: 정확 일치(in) vs 자모 n-gram 색인
+
+    python -m benchmarks.bench_fuzzy_keywords [--n 2000] [--noise 1] [--seed 7]
+
+학생증/면허증 형태의 합성 OCR 텍스트에 음절 내 자모 치환 노이즈를 넣고
+- 재현율: has_pharmacy_major / is_likely_student_card / 면허 필수 키워드 인식률
+- 오탐: 색인 어휘에 없는 실제 비약학 학과(식품영양학과·역학과 등, 노이즈 포함)가 약학으로
+  인정되는 비율, 미등록 대학(경기대학교 등)이 다른 대학으로 바뀌는 비율
+- 속도: 텍스트당 색인 매칭 시간 vs 어휘별 전수 편집 거리 탐색
+을 출력한다. Clova 호출 없음.
+"""
+import argparse
+import random
+import sys
+import time
+
+from services.common_ocr import (
+    KEYWORD_INDEX, LICENSE_REQUIRED_KWS, UNIVERSITY_NAMES, extract_university_regex, has_pharmacy_major,
+    is_likely_student_card, keyword_matches, matched_keywords,
+)
+from services.fuzzy_match import _CHO, _JONG, _JUNG, bounded_levenshtein, max_distance, to_jamo
+
+STUDENT_TMPL = "{univ} {dept} 학생증 성명 {name} 학번 2021{sid}"
+LICENSE_TMPL = "약사 면허증 성명 {name} 제 {no} 호 약사법 제3조에 의하여 위 사람은 약사 면허를 받았음을 증명함 {y}년 3월 2일 보건복지부 장관"
+NAMES = ["김민지", "이서준", "박지후", "최유나", "정하늘", "강도윤"]
+PHARM_DEPTS = ["약학대학", "약학과", "약학대학 약학과"]
+# 오탐 측정용: 색인 어휘(KEYWORD_DISTRACTORS 등)에 없는 실제 비약학 학과/대학
+OTHER_DEPTS = [
+    "식품영양학과", "영양학과", "역학과", "국악학과", "간호학과", "화학공학과", "생명과학과",
+    "생명공학과", "식품공학과", "치의학과", "수의학과", "한약자원학과", "약용작물학과",
+    "임상병리학과", "보건행정학과", "작업치료학과", "물리학과", "경영학과", "영어영문학과",
+    "생활과학대학 식품영양학과", "자연과학대학 화학과",
+]
+OTHER_UNIVERSITIES = [
+    "경기대학교", "한성대학교", "건국대학교", "광운대학교", "인하대학교", "서강대학교", "홍익대학교",
+    "국민대학교", "세종대학교", "명지대학교", "상명대학교", "숭실대학교",
+]
+
+
+def _compose(cho: int, jung: int, jong: int) -> str:
+    return chr(0xAC00 + cho * 588 + jung * 28 + jong)
+
+
+def _noisy_syllable(ch: str, rng: random.Random) -> str:
+    """한글 1음절의 초/중/종성 중 하나를 바꿈 (OCR 오인식 흉내)."""
+    if not ("가" <= ch <= "힣"):
+        return ch
+    code = ord(ch) - 0xAC00
+    parts = [code // 588, (code % 588) // 28, code % 28]
+    slot = rng.randrange(3)
+    sizes = (len(_CHO), len(_JUNG), len(_JONG))
+    parts[slot] = rng.randrange(sizes[slot])
+    return _compose(*parts)
+
+
+def add_noise(word: str, edits: int, rng: random.Random) -> str:
+    chars = list(word)
+    for _ in range(edits):
+        i = rng.randrange(len(chars))
+        chars[i] = _noisy_syllable(chars[i], rng)
+    return "".join(chars)
+
+
+def naive_find(text: str) -> set:
+    """비교 기준: 어휘마다 모든 시작/끝 위치에 대해 편집 거리 계산."""
+    J = to_jamo(text)
+    out = set()
+    for term in KEYWORD_INDEX.terms:
+        tj = to_jamo(term)
+        k = max_distance(len(tj))
+        for s in range(len(J)):
+            for e in range(s + max(1, len(tj) - k), min(len(J), s + len(tj) + k) + 1):
+                if bounded_levenshtein(tj, J[s:e], k) <= k:
+                    out.add(term)
+                    break
+            if term in out:
+                break
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=2000, help="문서 유형별 샘플 수")
+    ap.add_argument("--noise", type=int, default=1, help="키워드당 오인식 음절 수")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    students, others, licenses = [], [], []
+    for _ in range(args.n):
+        name, sid = rng.choice(NAMES), f"{rng.randrange(10**4):04d}"
+        univ = rng.choice(UNIVERSITY_NAMES)
+        students.append(STUDENT_TMPL.format(
+            univ=univ, dept=add_noise(rng.choice(PHARM_DEPTS), args.noise, rng),
+            name=name, sid=sid,
+        ).replace("학생증", add_noise("학생증", args.noise, rng)))
+        others.append(STUDENT_TMPL.format(
+            univ=rng.choice(OTHER_UNIVERSITIES), dept=add_noise(rng.choice(OTHER_DEPTS), args.noise, rng),
+            name=name, sid=sid,
+        ))
+        t = LICENSE_TMPL.format(name=name, no=rng.randrange(10000, 99999), y=rng.randrange(2005, 2025))
+        for kw in LICENSE_REQUIRED_KWS:
+            t = t.replace(kw, add_noise(kw, args.noise, rng))
+        licenses.append(t)
+
+    def exact_pharm(t):
+        return any(k in t for k in ("약학과", "약학대학", "약대", "약학", "PHARMACY"))
+
+    def exact_student(t):
+        return any(k in t for k in ("학생증", "학번", "대학교", "학과"))
+
+    def exact_license(t):
+        return all(k in t for k in LICENSE_REQUIRED_KWS)
+
+    def fuzzy_license(t):
+        return LICENSE_REQUIRED_KWS <= ({k for k in LICENSE_REQUIRED_KWS if k in t} | matched_keywords(t))
+
+    rows = [
+        ("약학 학과 인식 (학생증)", students, exact_pharm, has_pharmacy_major),
+        ("학생증 인식", students, exact_student, is_likely_student_card),
+        ("면허 필수 키워드", licenses, exact_license, fuzzy_license),
+        ("비약학 학과 오탐", others, exact_pharm, has_pharmacy_major),
+        ("미등록 대학 오인식", others, lambda t: False, lambda t: extract_university_regex(t) not in t),
+    ]
+    print(f"노이즈: 키워드당 {args.noise}음절, 샘플 {args.n}건/유형\n")
+    print(f"{'항목':<22} {'정확 일치':>10} {'근사 매칭':>10}")
+    for label, docs, exact_fn, fuzzy_fn in rows:
+        e = sum(map(exact_fn, docs)) / len(docs)
+        f = sum(map(fuzzy_fn, docs)) / len(docs)
+        print(f"{label:<22} {e:>10.1%} {f:>10.1%}")
+
+    docs = students + licenses
+    keyword_matches.cache_clear()
+    t0 = time.perf_counter()
+    for d in docs:
+        KEYWORD_INDEX.find(d)
+    t_index = (time.perf_counter() - t0) / len(docs)
+
+    sample = docs[:50]
+    t0 = time.perf_counter()
+    for d in sample:
+        naive_find(d)
+    t_naive = (time.perf_counter() - t0) / len(sample)
+
+    print(f"\n어휘 {len(KEYWORD_INDEX.terms)}개, 평균 텍스트 {sum(map(len, docs)) / len(docs):.0f}자")
+    print(f"색인 매칭:   {t_index * 1e3:.3f} ms/문서")
+    print(f"전수 탐색:   {t_naive * 1e3:.3f} ms/문서 ({t_naive / max(t_index, 1e-9):.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+레이아웃 템플릿 벤치마크: 휴리스틱만 vs 템플릿 영역 조회 (+ 미적중 필드만 휴리스틱)
+
+    python -m benchmarks.bench_layout_templates [--n 400] [--universities 6]
+
+대학별로 고정 배치(위치 흔들림/축척 변화 포함)를 가진 합성 학생증 OCR 결과를 만들고
+1) 절반을 검증 기록(ClovaStore)으로 남겨 scripts/build_layout_templates.build 로 템플릿 생성.
+   실제 기록과 같게 필드 값은 휴리스틱 추출 결과(틀린 값 포함)를 저장하고,
+   위치 일치 조건(--min-agreement) 적용/미적용 두 가지로 만든다
+2) 나머지 절반에 대해 verify_student.extract_fields 를 템플릿 없이/있이 실행해
+   문서당 추출 시간, 템플릿 적중률, 필드 정확도를 출력한다. Clova 호출 없음.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+os.environ.setdefault("CLOVA_OCR_URL", "http://bench.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "bench")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+from scripts.build_layout_templates import build  # noqa: E402
+from services import layout_templates  # noqa: E402
+from services.common_ocr import UNIVERSITY_NAMES, clova_ocr, merge_lines_by_y  # noqa: E402
+from services.ocr_replay import ClovaStore  # noqa: E402
+from services.verify_student import CONF_MIN, extract_fields  # noqa: E402
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서준지우현도하윤수아진예원태영성호은"
+DEPTS = ["약학과", "약학대학 약학과", "제약학과"]
+FILLER = ["서울특별시 관악구 관악로 1", "이 카드는 본교 학생임을 증명함", "STUDENT ID CARD", "총장", "유효기간 2026.02.28"]
+
+def _layout(rng: random.Random) -> Dict[str, Tuple[int, int]]:
+    """대학별 필드 배치 (x, y) — 대학마다 한 번 고정."""
+    ys = rng.sample([260, 320, 380, 440, 500], 3)
+    x = rng.choice([180, 220, 420])
+    return {"name": (x, ys[0]), "studentId": (x, ys[1]), "department": (x, ys[2])}
+
+def _box(text: str, x: float, y: float, conf: float = 0.99) -> Dict:
+    w, h = 24 * len(text), 28
+    return {
+        "inferText": text, "inferConfidence": conf,
+        "boundingPoly": {"vertices": [{"x": x, "y": y}, {"x": x + w, "y": y}, {"x": x + w, "y": y + h}, {"x": x, "y": y + h}]},
+    }
+
+def make_card(rng: random.Random, university: str, layout: Dict[str, Tuple[int, int]]) -> Tuple[Dict, Dict]:
+    """Clova 원본 응답 형태의 합성 학생증 + 정답 필드."""
+    truth = {
+        "name": rng.choice(SURNAMES) + "".join(rng.sample(GIVEN, 2)),
+        "studentId": f"20{rng.randint(15, 24)}{rng.randint(10000, 99999)}",
+        "university": university,
+        "department": rng.choice(DEPTS).split()[-1],
+    }
+    scale, jitter = rng.uniform(0.8, 1.3), lambda: rng.uniform(-6, 6)
+    boxes = [_box(university, 60, 40), _box("학생증", 60, 110)]
+    labels = {"name": "성명", "studentId": "학번", "department": "소속"}
+    for field, (x, y) in layout.items():
+        boxes.append(_box(labels[field], 60 + jitter(), y + jitter()))
+        boxes.append(_box(truth[field], x + jitter(), y + jitter()))
+    for i, text in enumerate(rng.sample(FILLER, 3)):
+        boxes.append(_box(text, 60 + jitter(), 580 + 60 * i + jitter()))
+    for b in boxes:
+        for v in b["boundingPoly"]["vertices"]:
+            v["x"], v["y"] = v["x"] * scale, v["y"] * scale
+    return {"images": [{"fields": boxes}]}, truth
+
+def _prepare(raw: Dict) -> Tuple[List[str], List]:
+    result = clova_ocr._convert_to_paddle_format(raw)
+    filtered = [b for b in sorted(result[0], key=lambda b: b[0][0][1]) if float(b[1][1]) >= CONF_MIN]
+    return merge_lines_by_y(filtered), filtered
+
+def _run(docs: List[Tuple[List[str], List, Dict]]) -> Tuple[float, float, Dict[str, int]]:
+    correct = {k: 0 for k in ("name", "studentId", "department")}
+    t0 = time.perf_counter()
+    outs = [extract_fields(lines, boxes) for lines, boxes, _ in docs]
+    elapsed = time.perf_counter() - t0
+    for (fields, _), (_, _, truth) in zip(outs, docs):
+        for k in correct:
+            correct[k] += fields[k] == truth[k]
+    hits = sum(status == "hit" for _, status in outs)
+    return elapsed / len(docs) * 1000, hits / len(docs), correct
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=400)
+    ap.add_argument("--universities", type=int, default=6)
+    ap.add_argument("--min-agreement", type=float, default=0.8)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    layouts = {u: _layout(rng) for u in rng.sample(UNIVERSITY_NAMES, args.universities)}
+    cards = [make_card(rng, u, layouts[u]) for u in rng.choices(list(layouts), k=args.n)]
+    train, test = cards[: args.n // 2], cards[args.n // 2:]
+
+    layout_templates.TEMPLATES = {}
+    with tempfile.TemporaryDirectory() as d:
+        store = ClovaStore(os.path.join(d, "train.sqlite"))
+        for raw, _ in train:
+            # 서버 기록과 같이 휴리스틱이 추출한 값(오답 포함)이 저장됨
+            fields, _ = extract_fields(*_prepare(raw))
+            vid = store.start_verification("student", "0" * 64)
+            store.add_call(vid, 0, "0" * 64, {}, raw, 0.0)
+            store.finish_verification(vid, {"valid": True, "fields": fields}, {})
+        templates = build(store, min_agreement=args.min_agreement)
+        unchecked = build(store, min_agreement=0.0)
+        store.close()
+    print(f"템플릿 {len(templates)}개, 필드 영역 {sum(len(t['fields']) for t in templates.values())}개"
+          f" (학습 {len(train)}건, 일치 조건 미적용 시 {sum(len(t['fields']) for t in unchecked.values())}개)")
+
+    docs = [(*_prepare(raw), truth) for raw, truth in test]
+    base_ms, _, base_ok = _run(docs)
+    layout_templates.TEMPLATES = unchecked
+    raw_ms, raw_hit, raw_ok = _run(docs)
+    layout_templates.TEMPLATES = templates
+    tpl_ms, hit_rate, tpl_ok = _run(docs)
+
+    n = len(docs)
+    print(f"{'':<18} {'ms/문서':>8} {'적중률':>7}  정확도(name/studentId/department)")
+    for label, ms, hit, ok in (
+        ("휴리스틱", base_ms, None, base_ok),
+        ("템플릿 (일치 조건 없음)", raw_ms, raw_hit, raw_ok),
+        (f"템플릿 (일치 ≥{args.min_agreement:.0%})", tpl_ms, hit_rate, tpl_ok),
+    ):
+        hit_s = "-" if hit is None else f"{hit:.0%}"
+        print(f"{label:<18} {ms:>8.3f} {hit_s:>7}  " + " / ".join(f"{ok[k] / n:.0%}" for k in ok))
+    print(f"추출 시간 절감: {base_ms - tpl_ms:.3f} ms/문서 ({1 - tpl_ms / base_ms:.0%})")
+    print(layout_templates.layout_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+방향 판정 벤치마크: 원본 해상도 후보 vs 프로브 썸네일 후보
+
+    python -m benchmarks.bench_orientation_probe [이미지 ...] [--long-side 960]
+    python -m benchmarks.bench_orientation_probe --synthetic [--long-side 960]
+
+각 샘플을 0/90/270도로 돌린 입력에 대해 두 방식의 판정 회전각이 같은지,
+그리고 방향 판정에 쓰인 OCR 업로드 바이트/지연이 얼마나 줄었는지 출력한다.
+실제 Clova OCR을 호출하므로 CLOVA_OCR_URL / CLOVA_SECRET_KEY 설정이 필요하다.
+--synthetic: 휴대폰 사진 크기의 합성 카드와, 정방향(가로 + 왼쪽 위 표식)에서만 면허증 문구를 돌려주는
+가짜 OCR 로 실행 (네트워크 없음). 지연은 후보 생성·인코딩 등 로컬 처리 시간만 해당.
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+from PIL import Image, ImageDraw, ImageStat
+
+# --synthetic 은 네트워크를 쓰지 않지만 ClovaOCR 생성에 설정값이 필요
+if "--synthetic" in sys.argv:
+    os.environ.setdefault("CLOVA_OCR_URL", "http://bench.invalid")
+    os.environ.setdefault("CLOVA_SECRET_KEY", "bench")
+
+from services.common_ocr import clova_ocr  # noqa: E402
+from services.image_utils import (  # noqa: E402
+    _best_rotation, _license_score, _student_score, _open_exif_transposed,
+)
+
+DEFAULT_SAMPLES = [
+    ("tests/images/sample_license.jpg", "license"),
+    ("tests/images/sample_student.jpg", "student"),
+]
+SCORERS = {"license": _license_score, "student": _student_score}
+
+
+class _MeteredOCR:
+    """ocr_lines 호출마다 업로드 바이트와 지연을 기록."""
+
+    def __init__(self, ocr_lines=None):
+        self.ocr_lines = ocr_lines or clova_ocr.ocr_lines
+        self.bytes = 0
+        self.seconds = 0.0
+        self.calls = 0
+
+    def __call__(self, path: str, conf_min: float = 0.7) -> List[str]:
+        self.bytes += os.path.getsize(path)
+        t0 = time.perf_counter()
+        try:
+            return self.ocr_lines(path, conf_min=conf_min)
+        finally:
+            self.seconds += time.perf_counter() - t0
+            self.calls += 1
+
+
+def _synthetic_card(seed: int) -> Image.Image:
+    """휴대폰 사진 크기(4032x3024) 카드: 노이즈 배경 + 정방향 기준 왼쪽 위 검은 표식."""
+    w, h = 4032, 3024
+    # 저해상도 노이즈를 확대해 사진처럼 부드러운 질감 (JPEG 크기가 실제 사진 수준)
+    noise = Image.effect_noise((w // 8, h // 8), 30 + seed * 10).resize((w, h), Image.BILINEAR)
+    img = Image.merge("RGB", (noise, noise.point(lambda v: v * 0.9), noise.point(lambda v: v * 0.8)))
+    ImageDraw.Draw(img).rectangle((0, 0, w // 4, h // 4), fill="black")
+    return img
+
+
+def _synthetic_ocr(path: str, conf_min: float = 0.7) -> List[str]:
+    """정방향 후보에서만 면허증 문구를 읽는 가짜 OCR."""
+    with Image.open(path) as im:
+        w, h = im.size
+        corner = im.convert("L").crop((0, 0, w // 8, h // 8))
+        if w > h and ImageStat.Stat(corner).mean[0] < 64:
+            return ["약사 면허증", "보건복지부 장관", "약사법 제3조"]
+    return ["가나다"]
+
+
+def _run(img: Image.Image, kind: str, long_side: int, ocr_lines=None) -> Dict:
+    meter = _MeteredOCR(ocr_lines)
+    t0 = time.perf_counter()
+    angle = _best_rotation(img, meter, SCORERS[kind], long_side)
+    total = time.perf_counter() - t0
+    # 실제 OCR 이면 OCR 시간, 가짜 OCR 이면 후보 생성·인코딩 포함 전체 로컬 시간
+    seconds = total if ocr_lines is not None else meter.seconds
+    return {"angle": angle, "bytes": meter.bytes, "seconds": seconds, "calls": meter.calls}
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("images", nargs="*", help="이미지 경로 (파일명에 license 포함 시 면허증으로 판정)")
+    ap.add_argument("--long-side", type=int, default=960, help="프로브 썸네일 긴 변(px)")
+    ap.add_argument("--synthetic", action="store_true", help="합성 카드 + 가짜 OCR (네트워크 없음)")
+    args = ap.parse_args(argv)
+
+    ocr_lines = _synthetic_ocr if args.synthetic else None
+    if args.synthetic:
+        samples = [(f"synthetic_license_{i}", "license", _synthetic_card(i)) for i in range(3)]
+    else:
+        paths = [(p, "license" if "license" in os.path.basename(p) else "student") for p in args.images]
+        paths = paths or [s for s in DEFAULT_SAMPLES if os.path.exists(s[0])]
+        samples = [(p, kind, _open_exif_transposed(p)) for p, kind in paths]
+    if not samples:
+        print("샘플 이미지가 없습니다.", file=sys.stderr)
+        return 1
+
+    total = {"full": {"bytes": 0, "seconds": 0.0}, "probe": {"bytes": 0, "seconds": 0.0}}
+    mismatches = 0
+    print(f"{'sample':<32} {'rot':>4} {'full°':>6} {'probe°':>6} {'full KB':>9} {'probe KB':>9} {'full s':>7} {'probe s':>7}")
+    for path, kind, base in samples:
+        for rot in (0, 90, 270):
+            img = base.rotate(rot, expand=True) if rot else base
+            full = _run(img, kind, 0, ocr_lines)
+            probe = _run(img, kind, args.long_side, ocr_lines)
+            same = full["angle"] == probe["angle"]
+            mismatches += 0 if same else 1
+            for mode, r in (("full", full), ("probe", probe)):
+                total[mode]["bytes"] += r["bytes"]
+                total[mode]["seconds"] += r["seconds"]
+            print(
+                f"{os.path.basename(path):<32} {rot:>4} {full['angle']:>6} {probe['angle']:>6}"
+                f" {full['bytes'] / 1024:>9.1f} {probe['bytes'] / 1024:>9.1f}"
+                f" {full['seconds']:>7.2f} {probe['seconds']:>7.2f}{'' if same else '  ← 판정 불일치'}"
+            )
+
+    fb, pb = total["full"]["bytes"], total["probe"]["bytes"]
+    fs, ps = total["full"]["seconds"], total["probe"]["seconds"]
+    print(f"\n판정 불일치: {mismatches}건")
+    print(f"프로브 바이트: {fb / 1024:.1f}KB → {pb / 1024:.1f}KB ({pb / max(1, fb):.1%})")
+    print(f"프로브 지연:   {fs:.2f}s → {ps:.2f}s ({ps / max(1e-9, fs):.1%})")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+응답 직렬화 벤치마크: 기존 dict + FastAPI 기본 인코더 vs 타입 모델 + FastJSONResponse
+
+    python -m benchmarks.bench_response_serialization [--n 20000]
+
+학생증/면허증 검증 결과 형태의 dict 를
+- 기존: jsonable_encoder + JSONResponse (json.dumps)
+- 신규: StudentOCRResponse/LicenseOCRResponse + render_result (verbose / verbose=false / fields=valid,fields)
+로 직렬화해 건당 시간과 응답 크기를 출력한다. Clova 호출 없음
+(routes 모듈 import 를 위해 CLOVA_OCR_URL / CLOVA_SECRET_KEY 는 아무 값이나 설정).
+"""
+import argparse
+import sys
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from routes.ocr_route import render_result
+from schema.types import LicenseOCRResponse, StudentOCRResponse
+
+STUDENT_RESULT = {
+    "valid": True,
+    "documentType": "student",
+    "is_student_card": True,
+    "has_pharmacy": True,
+    "looks_like_card": True,
+    "text": "서울대학교 STUDENT ID CARD 학생증 약학대학 약학과 성명 홍길동 학번 2021123456 "
+            "발급일 2021.03.02 서울대학교 총장 " * 3,
+    "fields": {"name": "홍길동", "studentId": "2021123456", "university": "서울대학교", "department": "약학과"},
+    "ocr_engine": "clova",
+}
+STUDENT_RESULT["text_length"] = len(STUDENT_RESULT["text"])
+
+LICENSE_RESULT = {
+    "valid": True,
+    "documentType": "license",
+    "text": "약사 면허증 제 12345 호 성명 홍길동 생년월일 1990년 1월 1일 약사법 제3조에 의하여 "
+            "위 사람은 약사 면허를 받았음을 증명함 2015년 3월 2일 보건복지부 장관 " * 3,
+    "fields": {"name": "홍길동", "licenseNumber": "12345", "issueDate": "2015-03-02"},
+    "has_required_keywords": True,
+    "has_required_fields": True,
+    "keyword_score": 3,
+    "ocr_engine": "clova",
+}
+
+
+def _bench(fn, n: int):
+    body = fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n, len(body)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=20000)
+    args = ap.parse_args(argv)
+
+    print(f"{'문서':<8} {'방식':<34} {'µs/건':>8} {'bytes':>7}")
+    for label, result, model in (
+        ("student", STUDENT_RESULT, StudentOCRResponse),
+        ("license", LICENSE_RESULT, LicenseOCRResponse),
+    ):
+        cases = [
+            ("dict + jsonable_encoder", lambda: JSONResponse(jsonable_encoder(dict(result))).body),
+            ("model + fast (verbose)", lambda: render_result(model.model_validate(result), None, True).body),
+            ("model + fast (verbose=false)", lambda: render_result(model.model_validate(result), None, False).body),
+            ("model + fast (fields=valid,fields)", lambda: render_result(model.model_validate(result), "valid,fields", True).body),
+        ]
+        base_t = None
+        for name, fn in cases:
+            t, size = _bench(fn, args.n)
+            base_t = base_t or t
+            print(f"{label:<8} {name:<34} {t * 1e6:>8.1f} {size:>7}  ({t / base_t:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
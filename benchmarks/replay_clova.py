@@ -0,0 +1,59 @@
+"""
+기록된 Clova 응답으로 검증 파이프라인 재생 (성능/결과 회귀 확인)
+
+    OCR_RECORD_PATH=/data/clova.sqlite OCR_RECORD_IMAGES=1  (서버 실행 시 기록, 재생하려면 이미지 원본 필요)
+    python -m benchmarks.replay_clova /data/clova.sqlite [--type student|license] [--limit N] [--json]
+
+네트워크 호출 없이 validate_student_card / validate_license_document 를 다시 실행해
+처리량, 단계별 시간(평균/p95), 응답 조회 통계, 기록 대비 valid/fields 변화를 출력한다.
+변화 또는 오류가 있으면 종료 코드 1.
+"""
+import argparse
+import json
+import os
+import sys
+
+# 재생은 네트워크를 쓰지 않지만 ClovaOCR 생성에 설정값이 필요
+os.environ.setdefault("CLOVA_OCR_URL", "http://replay.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "replay")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+from services.ocr_replay import ClovaStore, replay  # noqa: E402
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("store", help="OCR_RECORD_PATH 로 기록한 SQLite 파일")
+    ap.add_argument("--type", choices=("student", "license"), help="문서 유형 필터")
+    ap.add_argument("--limit", type=int, help="최대 재생 건수")
+    ap.add_argument("--json", action="store_true", help="보고서를 JSON 으로 출력")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists(args.store):
+        print(f"기록 파일이 없습니다: {args.store}", file=sys.stderr)
+        return 2
+    store = ClovaStore(args.store)
+    try:
+        report = replay(store, args.type, args.limit)
+    finally:
+        store.close()
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(f"재생 {report['replayed']}/{report['verifications']}건, {report['elapsed_sec']}s"
+              f" ({report['throughput_per_sec']}건/s), Clova 호출 {report['clova_calls']}회 (재생)")
+        print(f"응답 조회: {report['lookup']}")
+        print(f"\n{'단계':<12} {'평균 ms':>9} {'p95 ms':>9}")
+        for name, s in report["stage_ms"].items():
+            print(f"{name:<12} {s['mean']:>9.2f} {s['p95']:>9.2f}")
+        print(f"\n결과 변화: {len(report['changes'])}건")
+        for c in report["changes"]:
+            print(f"  #{c['id']} {c['doc_type']} valid {c['valid'][0]}→{c['valid'][1]} fields {c['fields']}")
+        for e in report["errors"]:
+            print(f"  #{e['id']} {e['doc_type']} 오류: {e['error']}")
+    return 1 if report["changes"] or report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routes.ocr_route import router as ocr_router
+from routes.admin_route import router as admin_router
 
 app = FastAPI(title="PillChat OCR 인증 서버")
 
@@ -16,6 +17,7 @@ app.add_middleware(
 
 # 라우터 등록
 app.include_router(ocr_router)
+app.include_router(admin_router)
 
 @app.get("/")
 def root():
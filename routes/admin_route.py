@@ -0,0 +1,62 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Header, Query
+from routes.ocr_route import OCR_INTERNAL_TOKEN, FastJSONResponse, verify_internal_token
+from services import profiling
+
+router = APIRouter(prefix="/ocr/admin", default_response_class=FastJSONResponse)
+
+def verify_admin_token(authorization: Optional[str]) -> None:
+    """관리자 기능은 OCR_INTERNAL_TOKEN 이 설정된 경우에만 사용 가능."""
+    if not OCR_INTERNAL_TOKEN:
+        raise HTTPException(status_code=404, detail="관리자 기능이 비활성화되어 있습니다.")
+    verify_internal_token(authorization)
+
+# 디렉터리 조회/tracemalloc 스냅샷·비교는 수 초 걸릴 수 있어 이벤트 루프를 막지 않도록 def(스레드풀)로 선언
+
+@router.get("/profiles")
+def list_profiles(authorization: Optional[str] = Header(None), limit: int = Query(50, ge=1, le=500)):
+    """OCR_PROFILE_DIR 에 저장된 요청 프로파일 목록 (최신순)."""
+    verify_admin_token(authorization)
+    return {"dir": profiling.PROFILE_DIR, "profiles": profiling.list_profiles(limit)}
+
+@router.get("/tracemalloc")
+def tracemalloc_status(authorization: Optional[str] = Header(None)):
+    verify_admin_token(authorization)
+    return profiling.tracemalloc_status()
+
+@router.post("/tracemalloc/start")
+def tracemalloc_start(authorization: Optional[str] = Header(None), nframes: int = Query(10, ge=1, le=100)):
+    verify_admin_token(authorization)
+    return profiling.tracemalloc_start(nframes)
+
+@router.post("/tracemalloc/stop")
+def tracemalloc_stop(authorization: Optional[str] = Header(None)):
+    verify_admin_token(authorization)
+    return profiling.tracemalloc_stop()
+
+@router.post("/tracemalloc/snapshot")
+def tracemalloc_snapshot(
+    authorization: Optional[str] = Header(None),
+    limit: int = Query(20, ge=1, le=200),
+    key_type: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+):
+    """현재 할당 상위 항목 반환 + 이후 diff 의 기준으로 저장."""
+    verify_admin_token(authorization)
+    try:
+        return profiling.tracemalloc_snapshot(limit, key_type)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@router.get("/tracemalloc/diff")
+def tracemalloc_diff(
+    authorization: Optional[str] = Header(None),
+    limit: int = Query(20, ge=1, le=200),
+    key_type: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+):
+    """기준 스냅샷 이후 메모리 증가 상위 항목."""
+    verify_admin_token(authorization)
+    try:
+        return profiling.tracemalloc_diff(limit, key_type)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
@@ -1,17 +1,36 @@
 import os
+import asyncio
 import tempfile
 import shutil
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Header
+from fastapi import APIRouter, UploadFile, File, HTTPException, Header, Query, Request
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+from starlette.concurrency import run_in_threadpool
+from schema.types import COMPACT_KEYS, OCRResult, StudentOCRResponse, LicenseOCRResponse
+from services.deadline import Deadline, DeadlineExceeded, cancel_stats, count
+from services import event_log
+from services.layout_templates import layout_stats
+from services.profiling import maybe_profiled
 from services.image_utils import ensure_landscape_for_student
-from services.common_ocr import clova_ocr
+from services.common_ocr import clova_ocr, visualize_save_path
 from services.verify_student import validate_student_card
 from services.verify_license import validate_license_document
 
-router = APIRouter(prefix="/ocr")
+class FastJSONResponse(JSONResponse):
+    """pydantic-core(Rust) 직렬화 JSON 응답 (기본 jsonable_encoder + json.dumps 대체)."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+router = APIRouter(prefix="/ocr", default_response_class=FastJSONResponse)
 
 OCR_INTERNAL_TOKEN = os.getenv("OCR_INTERNAL_TOKEN", "") 
+# 요청 마감 기본값(ms). X-Deadline-Ms 헤더(남은 시간 ms)가 있으면 우선. 0 이하면 마감 없음.
+OCR_DEADLINE_MS = int(os.getenv("OCR_DEADLINE_MS", "30000"))
+# 클라이언트 연결 종료 확인 주기(초)
+DISCONNECT_POLL_SEC = float(os.getenv("OCR_DISCONNECT_POLL_SEC", "0.25"))
 
 def verify_internal_token(authorization: Optional[str]) -> None:
     if not OCR_INTERNAL_TOKEN:
@@ -22,9 +41,48 @@ def verify_internal_token(authorization: Optional[str]) -> None:
     if token != OCR_INTERNAL_TOKEN:
         raise HTTPException(status_code=403, detail="Invalid token")
 
-@router.post("/student")
-async def ocr_student(file: UploadFile = File(...), authorization: Optional[str] = Header(None)):
+async def run_validation(request: Request, validate_fn: Callable[..., Dict], path: str, deadline: Deadline) -> Dict:
+    """
+    검증 파이프라인을 스레드풀에서 실행하면서 클라이언트 연결 종료를 감시.
+    연결이 끊기면 deadline 을 취소해 진행 중인 Clova 호출은 기다리지 않고(응답은 버림)
+    남은 호출/시각화는 건너뛰게 하고, 워커가 멈출 때까지 기다린 뒤 반환 (임시 파일 정리는 호출부 finally 에서).
+    """
+    task = asyncio.ensure_future(run_in_threadpool(validate_fn, path, deadline=deadline))
+    while not task.done():
+        await asyncio.wait({task}, timeout=DISCONNECT_POLL_SEC)
+        if not task.done() and not deadline.cancelled and await request.is_disconnected():
+            deadline.cancel("client disconnected")
+    try:
+        return task.result()
+    except DeadlineExceeded as e:
+        count("work_cancelled")
+        raise HTTPException(status_code=504, detail=f"OCR 처리 시간이 초과되었습니다: {e}")
+
+def render_result(model: OCRResult, fields: Optional[str], verbose: bool) -> FastJSONResponse:
+    """
+    응답 필드 선택:
+    - fields=valid,fields 처럼 최상위 키 지정 시 해당 키만 (valid 는 항상 포함)
+    - verbose=false 면 valid/documentType/message/fields 만 (OCR 원문·진단 플래그 제외)
+    """
+    include = None
+    if fields:
+        include = {f.strip() for f in fields.split(",") if f.strip()} | {"valid"}
+    elif not verbose:
+        include = COMPACT_KEYS
+    return FastJSONResponse(model.model_dump(include=include, exclude_none=True))
+
+@router.post("/student", response_model=StudentOCRResponse, response_model_exclude_none=True)
+async def ocr_student(
+    request: Request,
+    file: UploadFile = File(...),
+    authorization: Optional[str] = Header(None),
+    x_deadline_ms: Optional[str] = Header(None),
+    x_profile_token: Optional[str] = Header(None),
+    fields: Optional[str] = Query(None, description="응답에 포함할 최상위 키 (쉼표 구분)"),
+    verbose: bool = Query(True, description="false 면 OCR 원문/진단 플래그 제외"),
+):
     verify_internal_token(authorization)
+    deadline = Deadline.from_header(x_deadline_ms, OCR_DEADLINE_MS)
     if not file.filename:
         raise HTTPException(status_code=400, detail="파일명이 없습니다.")
     if file.content_type not in {"image/jpeg", "image/jpg", "image/png"}:
@@ -32,31 +90,50 @@ async def ocr_student(file: UploadFile = File(...), authorization: Optional[str]
 
     path = save_temp_file(file)
     try:
-        result = validate_student_card(path)
-        result.setdefault("fields", {"name": "", "studentId": "", "university": ""})
-        result.setdefault("documentType", "student")
-        if not result.get("valid") and "오류" not in result.get("message", ""):
-            result["message"] = "인증할 수 없는 학생증입니다."
-        return result
+        validate_fn = maybe_profiled(validate_student_card, "student", x_profile_token)
+        if clova_ocr.recorder is not None:
+            validate_fn = clova_ocr.recorder.wrap(validate_fn, "student")
+        validate_fn = event_log.wrap(validate_fn, "student")
+        result = StudentOCRResponse.model_validate(
+            await run_validation(request, validate_fn, path, deadline)
+        )
+        if not result.valid and "오류" not in (result.message or ""):
+            result.message = "인증할 수 없는 학생증입니다."
+        return render_result(result, fields, verbose)
     finally:
         cleanup_temp_file(path)
+        # 업로드 옆에 저장된 시각화 파일 (validate_student_card)
+        cleanup_temp_file(visualize_save_path(path, "clova_ocr"))
 
 
-@router.post("/professional")
-async def ocr_professional(file: UploadFile = File(...), authorization: Optional[str] = Header(None)):
+@router.post("/professional", response_model=LicenseOCRResponse, response_model_exclude_none=True)
+async def ocr_professional(
+    request: Request,
+    file: UploadFile = File(...),
+    authorization: Optional[str] = Header(None),
+    x_deadline_ms: Optional[str] = Header(None),
+    x_profile_token: Optional[str] = Header(None),
+    fields: Optional[str] = Query(None, description="응답에 포함할 최상위 키 (쉼표 구분)"),
+    verbose: bool = Query(True, description="false 면 OCR 원문/진단 플래그 제외"),
+):
     verify_internal_token(authorization)
+    deadline = Deadline.from_header(x_deadline_ms, OCR_DEADLINE_MS)
     if not file.filename:
         raise HTTPException(status_code=400, detail="파일명이 없습니다.")
     if file.content_type not in {"image/jpeg", "image/jpg", "image/png"}:
         raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
     path = save_temp_file(file)
     try:
-        result = validate_license_document(path)
-        result.setdefault("fields", {"name": "", "licenseNumber": "", "issueDate": ""})
-        result.setdefault("documentType", "license")
-        if not result.get("valid") and "오류" not in result.get("message", ""):
-            result["message"] = "인증할 수 없는 면허증입니다."
-        return result
+        validate_fn = maybe_profiled(validate_license_document, "license", x_profile_token)
+        if clova_ocr.recorder is not None:
+            validate_fn = clova_ocr.recorder.wrap(validate_fn, "license")
+        validate_fn = event_log.wrap(validate_fn, "license")
+        result = LicenseOCRResponse.model_validate(
+            await run_validation(request, validate_fn, path, deadline)
+        )
+        if not result.valid and "오류" not in (result.message or ""):
+            result.message = "인증할 수 없는 면허증입니다."
+        return render_result(result, fields, verbose)
     finally:
         cleanup_temp_file(path)
 
@@ -68,7 +145,17 @@ async def health_check():
         return {"status": "warning", "message": "Clova OCR API 설정이 필요합니다.", "ocr_engine": "clova", "config_status": "incomplete"}
     return {"status": "healthy", "message": "OCR 서비스가 정상 작동 중입니다.", "ocr_engine": "clova", "config_status": "complete"}
 
-        
+
+@router.get("/stats")
+async def ocr_stats(authorization: Optional[str] = Header(None)):
+    """취소된 작업 수 / 마감·연결 종료로 보내지 않은(또는 응답을 버린) Clova 호출 수 / 이벤트 로그 상태 / 레이아웃 템플릿 적중률."""
+    verify_internal_token(authorization)
+    return {
+        "cancellation": cancel_stats(),
+        "event_log": event_log.event_log.status(),
+        "layout_templates": layout_stats(),
+    }
+
 def save_temp_file(upload_file: UploadFile) -> str:
     """업로드된 파일을 임시 파일로 저장"""
     suffix = upload_file.filename.split(".")[-1] if upload_file.filename else "jpg"
@@ -83,4 +170,4 @@ def cleanup_temp_file(file_path: str):
         if os.path.exists(file_path):
             os.unlink(file_path)
     except Exception as e:
-        print(f"[⚠️ 임시파일 삭제 실패] {file_path}: {e}")
+        event_log.warn("temp_cleanup_failed", "임시파일 삭제 실패", path=file_path, error=str(e))
@@ -1,7 +1,46 @@
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, Optional
 
 class OCRResult(BaseModel):
     valid: bool
     text: str
     fields: Dict[str, str]
+
+class StudentFields(BaseModel):
+    name: str = ""
+    studentId: str = ""
+    university: str = ""
+    department: str = ""
+
+class LicenseFields(BaseModel):
+    name: str = ""
+    licenseNumber: str = ""
+    issueDate: str = ""
+
+class StudentOCRResponse(OCRResult):
+    """POST /ocr/student 응답. 진단 플래그는 verbose 응답에만 포함."""
+    documentType: str = "student"
+    message: Optional[str] = None
+    text: Optional[str] = None
+    fields: StudentFields = StudentFields()
+    is_student_card: Optional[bool] = None
+    has_pharmacy: Optional[bool] = None
+    looks_like_card: Optional[bool] = None
+    text_length: Optional[int] = None
+    layout_template: Optional[str] = None
+    ocr_engine: Optional[str] = None
+
+class LicenseOCRResponse(OCRResult):
+    """POST /ocr/professional 응답. 진단 플래그는 verbose 응답에만 포함."""
+    documentType: str = "license"
+    message: Optional[str] = None
+    text: Optional[str] = None
+    fields: LicenseFields = LicenseFields()
+    has_required_keywords: Optional[bool] = None
+    has_required_fields: Optional[bool] = None
+    keyword_score: Optional[int] = None
+    layout_template: Optional[str] = None
+    ocr_engine: Optional[str] = None
+
+# verbose=false 일 때 남기는 최상위 키
+COMPACT_KEYS = frozenset({"valid", "documentType", "message", "fields"})
@@ -0,0 +1,151 @@
+"""
+기록된 Clova 응답에서 기관별 레이아웃 템플릿 생성
+
+    OCR_RECORD_PATH=/data/clova.sqlite  (서버 실행 시 기록) 또는 scripts/bulk_verify.py 의 --ocr-cache
+    python -m scripts.build_layout_templates /data/clova.sqlite --out layout_templates.json [--min-samples 5]
+
+valid 로 끝난 검증마다 최종 OCR 응답에서 휴리스틱이 추출한 필드 값이 들어 있는 박스(또는 같은 줄 박스 묶음)를
+찾아 정규화 좌표를 모은다. 휴리스틱 값은 틀릴 수 있으므로, 박스가 중앙값 위치(세로 중심, 왼쪽 또는 오른쪽 끝)에서
+AGREE_TOL 이내인 표본이
+--min-samples 이상이고 해당 기관 표본의 --min-agreement 이상인 (기관, 필드)만 영역으로 저장한다.
+영역 = 일치한 표본들의 외접 사각형 + --margin. 필드 값 자체(PII)는 저장하지 않는다.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence
+
+# 네트워크를 쓰지 않지만 ClovaOCR 생성에 설정값이 필요
+os.environ.setdefault("CLOVA_OCR_URL", "http://templates.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "templates")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+from services.common_ocr import clova_ocr  # noqa: E402
+from services.layout_templates import BoxIndex, Region, template_key  # noqa: E402
+from services.ocr_replay import ClovaStore  # noqa: E402
+from services import verify_license, verify_student  # noqa: E402
+
+# 같은 위치로 보는 거리 (정규화 좌표). 값 길이에 따라 폭이 달라지므로 가로는 왼쪽/오른쪽 끝 중 하나만 맞으면 됨
+AGREE_TOL = 0.05
+
+def _line_groups(boxes: Sequence) -> List[List]:
+    """세로 중심이 박스 높이 절반 이내로 겹치는 박스끼리 한 줄로 묶음 (왼→오른)."""
+    def center_y(b):
+        return (b[0][0][1] + b[0][2][1]) / 2
+
+    groups: List[List] = []
+    for b in sorted(boxes, key=center_y):
+        half = abs(b[0][2][1] - b[0][0][1]) / 2
+        if groups and abs(center_y(groups[-1][-1]) - center_y(b)) <= half:
+            groups[-1].append(b)
+        else:
+            groups.append([b])
+    return [sorted(g, key=lambda b: b[0][0][0]) for g in groups if len(g) > 1]
+
+def _locate(index: BoxIndex, boxes: Sequence, value: str, parse: Callable[[str], str]) -> Optional[Region]:
+    """parse(텍스트) == value 인 박스(없으면 줄 묶음)의 정규화 외접 사각형."""
+    for group in [[b] for b in boxes] + _line_groups(boxes):
+        if parse(" ".join(b[1][0] for b in group)) == value:
+            return index.normalize([p for b in group for p in b[0]])
+    return None
+
+def _median(values: List[float]) -> float:
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def _agreed_region(
+    rects: List[Region], samples: int, min_samples: int, min_agreement: float, margin: float,
+) -> Optional[List[float]]:
+    """
+    중앙값 위치 근처(AGREE_TOL)에 모인 표본만으로 영역 계산.
+    모인 표본이 min_samples 미만이거나 전체 표본(samples) 대비 min_agreement 미만이면 None.
+    """
+    if not rects:
+        return None
+    mx0, mx1 = _median([r[0] for r in rects]), _median([r[2] for r in rects])
+    my = _median([(r[1] + r[3]) / 2 for r in rects])
+    agreed = [
+        r for r in rects
+        if abs((r[1] + r[3]) / 2 - my) <= AGREE_TOL and (abs(r[0] - mx0) <= AGREE_TOL or abs(r[2] - mx1) <= AGREE_TOL)
+    ]
+    if len(agreed) < min_samples or len(agreed) < min_agreement * samples:
+        return None
+    return [
+        round(max(0.0, min(r[0] for r in agreed) - margin), 4),
+        round(max(0.0, min(r[1] for r in agreed) - margin), 4),
+        round(min(1.0, max(r[2] for r in agreed) + margin), 4),
+        round(min(1.0, max(r[3] for r in agreed) + margin), 4),
+    ]
+
+def build(
+    store: ClovaStore, min_samples: int = 5, margin: float = 0.02, min_agreement: float = 0.8,
+) -> Dict[str, Dict]:
+    docs = {
+        "student": (verify_student.CONF_MIN, verify_student.FIELD_PARSERS),
+        "license": (verify_license.CONF_MIN, verify_license.FIELD_PARSERS),
+    }
+    rects: Dict[str, Dict[str, List[Region]]] = defaultdict(lambda: defaultdict(list))
+    samples: Dict[str, int] = defaultdict(int)
+    for v in store.verifications():
+        if not v["valid"] or v["doc_type"] not in docs:
+            continue
+        calls = store.calls_for(v["id"])
+        if not calls:
+            continue
+        conf_min, parsers = docs[v["doc_type"]]
+        boxes = [b for b in clova_ocr._convert_to_paddle_format(calls[-1])[0] if float(b[1][1]) >= conf_min]
+        if v["doc_type"] == "student":
+            if not v["fields"].get("university"):
+                continue
+            key = template_key("student", v["fields"]["university"])
+        else:
+            key = template_key("license")
+        samples[key] += 1
+        index = BoxIndex(boxes)
+        for name, parse in parsers.items():
+            value = v["fields"].get(name)
+            rect = _locate(index, boxes, value, parse) if value else None
+            if rect is not None:
+                rects[key][name].append(rect)
+
+    templates: Dict[str, Dict] = {}
+    for key, by_field in sorted(rects.items()):
+        fields = {}
+        for name, rs in by_field.items():
+            region = _agreed_region(rs, samples[key], min_samples, min_agreement, margin)
+            if region is not None:
+                fields[name] = region
+        if fields:
+            templates[key] = {"samples": samples[key], "fields": fields}
+    return templates
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("store", help="OCR_RECORD_PATH / --ocr-cache SQLite 파일")
+    ap.add_argument("--out", default="layout_templates.json", help="템플릿 JSON (OCR_LAYOUT_TEMPLATES 로 지정)")
+    ap.add_argument("--min-samples", type=int, default=5, help="필드 영역을 만들 최소 표본 수")
+    ap.add_argument("--margin", type=float, default=0.02, help="영역 여백 (정규화 좌표)")
+    ap.add_argument("--min-agreement", type=float, default=0.8,
+                    help="같은 위치에서 찾은 표본의 최소 비율 (기관 표본 대비)")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists(args.store):
+        print(f"기록 파일이 없습니다: {args.store}", file=sys.stderr)
+        return 2
+    store = ClovaStore(args.store)
+    try:
+        templates = build(store, args.min_samples, args.margin, args.min_agreement)
+    finally:
+        store.close()
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(templates, f, ensure_ascii=False, indent=2)
+    for key, tpl in templates.items():
+        print(f"{key}: 표본 {tpl['samples']}건, 필드 {sorted(tpl['fields'])}")
+    print(f"→ {args.out} ({len(templates)}개 템플릿)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+저장된 학생증/면허증 이미지 일괄 재검증 (HTTP 라우트 없이 오프라인 실행)
+
+    # 디렉터리 전체를 면허증으로 검증 (Clova 동시 호출 4개 제한)
+    python -m scripts.bulk_verify --dir /data/licenses --type license --out results.jsonl --workers 8 --max-inflight 4
+
+    # 매니페스트(CSV/JSONL: path,type) 기반, CSV 출력
+    python -m scripts.bulk_verify --manifest cards.csv --out results.csv
+
+    # 규칙 변경 후: 첫 실행의 OCR 캐시에 텍스트 규칙만 재적용 (Clova 호출 0회)
+    python -m scripts.bulk_verify --manifest cards.csv --out results_v2.csv --reuse-ocr --ocr-cache results.ocr.sqlite
+
+- 출력 파일이 곧 체크포인트: 같은 --out 으로 다시 실행하면 이미 기록된 (path, type) 은 건너뛴다.
+  error 로 끝난 행(Clova 5xx, 타임아웃 등)은 다시 시도하며, 같은 (path, type) 은 마지막 행이 최신 결과
+- Clova 결과는 --ocr-cache(SQLite, 기본 <out>.ocr.sqlite)에 쌓인다.
+  --reuse-ocr 는 새 --out 으로 실행하므로 읽을 캐시를 --ocr-cache 로 반드시 지정
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+IMAGE_EXTS = {".jpg", ".jpeg", ".png"}
+DOC_TYPES = ("student", "license")
+CSV_COLUMNS = [
+    "path", "type", "sha256", "valid",
+    "name", "studentId", "university", "department", "licenseNumber", "issueDate",
+    "clova_calls", "elapsed_ms", "source", "error",
+]
+
+# ------------------------
+# 입력
+# ------------------------
+def iter_directory(root: str, doc_type: str) -> Iterator[Dict]:
+    for dirpath, _, filenames in os.walk(root):
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTS:
+                yield {"path": os.path.join(dirpath, name), "type": doc_type}
+
+def iter_manifest(path: str, default_type: Optional[str]) -> Iterator[Dict]:
+    """CSV(헤더 path[,type]) 또는 JSONL({"path":..., "type":...}). 상대 경로는 매니페스트 기준."""
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding="utf-8") as f:
+        rows = (json.loads(line) for line in f if line.strip()) if path.endswith(".jsonl") else csv.DictReader(f)
+        for row in rows:
+            doc_type = row.get("type") or default_type
+            if doc_type not in DOC_TYPES:
+                raise ValueError(f"문서 유형을 알 수 없습니다: {row}")
+            yield {"path": os.path.join(base, row["path"]), "type": doc_type}
+
+# ------------------------
+# 출력 / 체크포인트
+# ------------------------
+class ResultWriter:
+    """JSONL/CSV 로 한 줄씩 즉시 기록. 오류 없이 기록된 (path, type) 목록을 제공해 재개에 사용."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.is_csv = path.endswith(".csv")
+        self._repair_tail()
+        self.done: Set[Tuple[str, str]] = self._load_done()
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._f = open(path, "a", encoding="utf-8", newline="")
+        self._csv = csv.DictWriter(self._f, fieldnames=CSV_COLUMNS) if self.is_csv else None
+        if self._csv and new_file:
+            self._csv.writeheader()
+            self._f.flush()
+
+    def _repair_tail(self) -> None:
+        # 중단 시 마지막 줄이 잘렸으면 마지막 개행까지만 남김
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def _load_done(self) -> Set[Tuple[str, str]]:
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path, encoding="utf-8", newline="") as f:
+            rows = csv.DictReader(f) if self.is_csv else map(json.loads, filter(str.strip, f))
+            # 오류 행은 완료로 보지 않음 → 재실행 시 다시 시도
+            return {(r["path"], r["type"]) for r in rows if r.get("type") and not r.get("error")}
+
+    def write(self, row: Dict) -> None:
+        if self._csv:
+            flat = {k: row.get(k, "") for k in CSV_COLUMNS}
+            flat.update({k: v for k, v in (row.get("fields") or {}).items() if k in CSV_COLUMNS})
+            self._csv.writerow(flat)
+        else:
+            self._f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._f.flush()
+        if not row.get("error"):
+            self.done.add((row["path"], row["type"]))
+
+    def close(self) -> None:
+        self._f.close()
+
+# ------------------------
+# 워커 프로세스
+# ------------------------
+_worker: Dict = {}
+
+def _init_worker(limiter, cache_path: str, reuse_ocr: bool) -> None:
+    if reuse_ocr:
+        # 캐시만 읽으므로 Clova 설정 불필요
+        os.environ.setdefault("CLOVA_OCR_URL", "http://reuse-ocr.invalid")
+        os.environ.setdefault("CLOVA_SECRET_KEY", "reuse-ocr")
+    os.environ.pop("OCR_RECORD_PATH", None)
+    # 원본 이미지 폴더에 시각화 파일을 남기지 않음
+    os.environ["OCR_VISUALIZE"] = "0"
+
+    from services.common_ocr import clova_ocr
+    from services.ocr_replay import ClovaRecorder, ClovaStore
+    from services.verify_license import license_result_from_ocr, validate_license_document
+    from services.verify_student import student_result_from_ocr, validate_student_card
+
+    store = ClovaStore(cache_path)
+    recorder = ClovaRecorder(store, keep_images=False)
+    clova_ocr.limiter = limiter
+    if not reuse_ocr:
+        clova_ocr.recorder = recorder
+    _worker.update(
+        clova_ocr=clova_ocr, store=store, recorder=recorder, reuse_ocr=reuse_ocr,
+        validators={"student": validate_student_card, "license": validate_license_document},
+        student_rules=student_result_from_ocr, license_rules=license_result_from_ocr,
+    )
+
+def _verify_one(item: Dict) -> Dict:
+    from services.ocr_replay import file_sha256
+    from services.stages import collect
+
+    path, doc_type = item["path"], item["type"]
+    row: Dict = {"path": path, "type": doc_type, "clova_calls": 0, "source": "cache" if _worker["reuse_ocr"] else "clova"}
+    t0 = time.perf_counter()
+    try:
+        row["sha256"] = file_sha256(path)
+        with collect() as st:
+            if _worker["reuse_ocr"]:
+                result = _rules_from_cache(row["sha256"], doc_type, path)
+            else:
+                result = _worker["recorder"].wrap(_worker["validators"][doc_type], doc_type)(path)
+        row.update(valid=bool(result.get("valid")), fields=result.get("fields") or {}, clova_calls=st.clova_calls)
+    except Exception as e:
+        row["error"] = repr(e)
+    row["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+    return row
+
+def _rules_from_cache(sha: str, doc_type: str, path: str) -> Dict:
+    store = _worker["store"]
+    vid = store.latest_verification(sha, doc_type)
+    calls = store.calls_for(vid) if vid is not None else []
+    if not calls:
+        raise LookupError("OCR 캐시 없음")
+    # 검증의 마지막 Clova 호출 = 최종 OCR (면허증은 앞선 호출들이 방향 판정용)
+    result = _worker["clova_ocr"]._convert_to_paddle_format(calls[-1])
+    if doc_type == "student":
+        return _worker["student_rules"](result, path)
+    return _worker["license_rules"](result)
+
+# ------------------------
+# 실행
+# ------------------------
+def run(items: Iterator[Dict], writer: ResultWriter, workers: int, max_inflight: int,
+        cache_path: str, reuse_ocr: bool) -> Dict:
+    ctx = multiprocessing.get_context("spawn")
+    limiter = ctx.BoundedSemaphore(max_inflight)
+    stats = {"done": 0, "skipped": 0, "errors": 0, "valid": 0, "clova_calls": 0}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(limiter, cache_path, reuse_ocr)) as pool:
+        pending = set()
+        for item in items:
+            if (item["path"], item["type"]) in writer.done:
+                stats["skipped"] += 1
+                continue
+            pending.add(pool.submit(_verify_one, item))
+            # 제출량 제한 (메모리/재개 지점 보호)
+            if len(pending) >= workers * 4:
+                pending = _drain(pending, writer, stats, FIRST_COMPLETED)
+        _drain(pending, writer, stats, ALL_COMPLETED)
+    stats["elapsed_sec"] = round(time.perf_counter() - started, 2)
+    stats["per_sec"] = round(stats["done"] / stats["elapsed_sec"], 2) if stats["elapsed_sec"] else 0.0
+    return stats
+
+def _drain(pending: set, writer: ResultWriter, stats: Dict, return_when: str) -> set:
+    done, rest = wait(pending, return_when=return_when)
+    for fut in done:
+        row = fut.result()
+        writer.write(row)
+        stats["done"] += 1
+        stats["errors"] += 1 if row.get("error") else 0
+        stats["valid"] += 1 if row.get("valid") else 0
+        stats["clova_calls"] += row.get("clova_calls", 0)
+        if stats["done"] % 100 == 0:
+            print(f"[진행] {stats['done']}건 (오류 {stats['errors']}, Clova {stats['clova_calls']}회)", file=sys.stderr)
+    return rest
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--dir", help="이미지 디렉터리 (하위 폴더 포함)")
+    src.add_argument("--manifest", help="CSV(path,type) 또는 JSONL 매니페스트")
+    ap.add_argument("--type", choices=DOC_TYPES, help="문서 유형 (--dir 필수, 매니페스트는 기본값)")
+    ap.add_argument("--out", required=True, help="결과 파일 (.jsonl 또는 .csv), 재실행 시 이어서 진행")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="프로세스 수")
+    ap.add_argument("--max-inflight", type=int, default=4, help="전체 프로세스 합산 Clova 동시 호출 수")
+    ap.add_argument("--ocr-cache", help="OCR 결과 캐시 SQLite (기본: <out>.ocr.sqlite)")
+    ap.add_argument("--reuse-ocr", action="store_true", help="--ocr-cache 의 OCR 결과에 텍스트 규칙만 재적용 (Clova 호출 없음)")
+    args = ap.parse_args(argv)
+
+    if args.dir and not args.type:
+        ap.error("--dir 사용 시 --type 이 필요합니다.")
+    if args.reuse_ocr and not args.ocr_cache:
+        ap.error("--reuse-ocr 사용 시 --ocr-cache 로 읽을 캐시를 지정해야 합니다.")
+    cache_path = args.ocr_cache or f"{os.path.splitext(args.out)[0]}.ocr.sqlite"
+    if args.reuse_ocr and not os.path.exists(cache_path):
+        ap.error(f"OCR 캐시가 없습니다: {cache_path}")
+
+    items = iter_directory(args.dir, args.type) if args.dir else iter_manifest(args.manifest, args.type)
+    writer = ResultWriter(args.out)
+    try:
+        stats = run(items, writer, max(1, args.workers), max(1, args.max_inflight), cache_path, args.reuse_ocr)
+    finally:
+        writer.close()
+    print(json.dumps(stats, ensure_ascii=False))
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
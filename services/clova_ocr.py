@@ -2,9 +2,17 @@ import os
 import uuid
 import time
 import json
+import threading
 import requests
+from contextlib import nullcontext
 from typing import Dict, List, Optional, Tuple
 
+from services.deadline import Deadline, DeadlineExceeded, count
+from services.stages import add_clova_call
+
+# 진행 중인 호출 대기 중 취소 확인 주기(초)
+CANCEL_POLL_SEC = 0.05
+
 class ClovaOCR:
     def __init__(
         self,
@@ -21,13 +29,25 @@ class ClovaOCR:
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
         self.max_retries = max_retries
+        # 기록/재생 훅 (services/ocr_replay.py). None 이면 평소처럼 API 호출만
+        self.recorder = None
+        self.replayer = None
+        # 동시 API 호출 제한 (threading/multiprocessing Semaphore 등 context manager). None 이면 무제한
+        self.limiter = None
         if not self.api_url or not self.secret_key:
             raise ValueError("Clova OCR 설정(api_url/secret_key)이 비어 있습니다.")
 
-    def ocr(self, image_path: str, template_ids: Optional[List[str]] = None, lang: Optional[str] = None) -> List[List]:
+    def ocr(
+        self,
+        image_path: str,
+        template_ids: Optional[List[str]] = None,
+        lang: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> List[List]:
         """
         Clova OCR(v2) 호출 → PaddleOCR 유사 포맷 반환
         반환: [ [ [bbox4], (text, conf) ], ... ] 를 한 번 더 감싼 [[...]]
+        deadline 지정 시 호출/재시도 전에 만료를 확인하고, 타임아웃을 남은 시간으로 제한
         """
         ext = (os.path.splitext(image_path)[1].lower().lstrip(".") or "jpg")
         request_json: Dict = {
@@ -42,25 +62,31 @@ class ClovaOCR:
         if (lang or self.default_lang) and (lang or self.default_lang) != "auto":
             request_json["lang"] = lang or self.default_lang
 
+        add_clova_call()
+        if self.replayer is not None:
+            return self._convert_to_paddle_format(self.replayer.lookup(image_path, request_json))
+        t0 = time.perf_counter()
+        clova_result = self._call_api(image_path, request_json, deadline)
+        if self.recorder is not None:
+            self.recorder.record_call(image_path, request_json, clova_result, time.perf_counter() - t0)
+        return self._convert_to_paddle_format(clova_result)
+
+    def _call_api(self, image_path: str, request_json: Dict, deadline: Optional[Deadline]) -> Dict:
+        """Clova API 호출 (재시도 포함) → 원본 응답 JSON."""
         payload = {"message": json.dumps(request_json).encode("utf-8")}
         headers = {"X-OCR-SECRET": self.secret_key}
+        with open(image_path, "rb") as f:
+            files = [("file", (os.path.basename(image_path), f.read()))]
 
         # 간단 재시도
         last_err: Optional[Exception] = None
         for attempt in range(self.max_retries + 1):
+            if deadline is not None:
+                deadline.check("clova", pending_calls=1)
             try:
-                with open(image_path, "rb") as f:
-                    files = [("file", f)]
-                    resp = requests.post(
-                        self.api_url,
-                        headers=headers,
-                        data=payload,
-                        files=files,
-                        timeout=(self.connect_timeout, self.read_timeout),
-                    )
+                resp = self._post(headers, payload, files, deadline)
                 if resp.status_code == 200:
-                    clova_result = resp.json()
-                    return self._convert_to_paddle_format(clova_result)
+                    return resp.json()
                 else:
                     # 4xx는 즉시 실패, 5xx는 재시도
                     msg = f"Clova OCR API 실패[{resp.status_code}]: {resp.text[:200]}"
@@ -70,6 +96,9 @@ class ClovaOCR:
                     raise RuntimeError(msg)
             except (requests.Timeout, requests.ConnectionError) as e:
                 last_err = e
+                # 마감으로 잘린 타임아웃이면 재시도 대신 중단
+                if deadline is not None:
+                    deadline.check("clova")
                 if attempt < self.max_retries:
                     time.sleep(0.6 * (attempt + 1))
                     continue
@@ -79,6 +108,46 @@ class ClovaOCR:
         # 여기 오면 전부 실패
         raise RuntimeError(f"Clova OCR 요청 반복 실패: {last_err}")
 
+    def _post(self, headers: Dict, payload: Dict, files: List, deadline: Optional[Deadline]) -> requests.Response:
+        """
+        API 요청 1회. deadline 이 있으면 별도 스레드에서 보내고, 응답 전에 취소되면(클라이언트 연결 종료)
+        기다리지 않고 DeadlineExceeded. 보낸 요청은 타임아웃까지 백그라운드에서 끝나고 결과는 버림.
+        """
+        def send() -> requests.Response:
+            with self.limiter if self.limiter is not None else nullcontext():
+                return requests.post(
+                    self.api_url, headers=headers, data=payload, files=files, timeout=self._timeout(deadline),
+                )
+
+        if deadline is None:
+            return send()
+        box: Dict = {}
+        done = threading.Event()
+
+        def run() -> None:
+            try:
+                box["resp"] = send()
+            except BaseException as e:
+                box["error"] = e
+            finally:
+                done.set()
+
+        threading.Thread(target=run, name="clova-call", daemon=True).start()
+        while not done.wait(CANCEL_POLL_SEC):
+            if deadline.cancelled:
+                count("clova_calls_abandoned")
+                raise DeadlineExceeded(f"{deadline.reason} (clova in flight)")
+        if "error" in box:
+            raise box["error"]
+        return box["resp"]
+
+    def _timeout(self, deadline: Optional[Deadline]) -> Tuple[float, float]:
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is None:
+            return (self.connect_timeout, self.read_timeout)
+        remaining = max(remaining, 0.1)
+        return (min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+
     def _convert_to_paddle_format(self, clova_result: Dict) -> List[List]:
         """
         Clova 응답 -> Paddle 형식 [[[[x,y]...], ('text', conf)], ...]
@@ -111,12 +180,12 @@ class ClovaOCR:
         return [paddle]
 
     # 헬퍼: 상위 로직에서 빠르게 라인 리스트만 쓰고 싶을 때
-    def ocr_lines(self, image_path: str, conf_min: float = 0.7) -> List[str]:
+    def ocr_lines(self, image_path: str, conf_min: float = 0.7, deadline: Optional[Deadline] = None) -> List[str]:
         """
         OCR → conf >= conf_min 만 골라 Y순 정렬 후 텍스트 라인 리스트 반환
         (정밀한 병합은 서비스 레벨에서 처리)
         """
-        result = self.ocr(image_path)
+        result = self.ocr(image_path, deadline=deadline)
         items = [b for b in result[0] if float(b[1][1]) >= conf_min]
         # Y 중심 기준 정렬
         def _ycenter(b):
@@ -1,10 +1,13 @@
 import os
 import re
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 from dotenv import load_dotenv
 
 from services.clova_ocr import ClovaOCR
-from services.visualize import visualize_ocr_result
+from services.fuzzy_match import FuzzyIndex, FuzzyMatch, select_matches
+from services.ocr_replay import ClovaRecorder, ClovaStore
+from services.visualize import visualize_enabled, visualize_ocr_result
 
 load_dotenv()
 
@@ -12,6 +15,13 @@ CLOVA_OCR_URL = os.getenv("CLOVA_OCR_URL")
 CLOVA_SECRET_KEY = os.getenv("CLOVA_SECRET_KEY")
 clova_ocr = ClovaOCR(CLOVA_OCR_URL, CLOVA_SECRET_KEY)
 
+# Clova 응답 기록 모드 (SQLite 경로). 재생은 benchmarks/replay_clova.py
+# 입력 이미지 원본은 OCR_RECORD_IMAGES=1 일 때만 저장 (기본: 해시만)
+OCR_RECORD_PATH = os.getenv("OCR_RECORD_PATH")
+OCR_RECORD_IMAGES = os.getenv("OCR_RECORD_IMAGES", "0") == "1"
+if OCR_RECORD_PATH:
+    clova_ocr.recorder = ClovaRecorder(ClovaStore(OCR_RECORD_PATH), keep_images=OCR_RECORD_IMAGES)
+
 PHARMACY_KEYWORDS = ["약학과", "약학대학", "약대", "약학", "PHARMACY"]
 STUDENT_CARD_KWS  = ["학생증", "학번", "대학교", "Student ID", "학과", "STUDENT", "ID CARD"]
 
@@ -23,6 +33,38 @@ LICENSE_NO_PATTERNS = [
     r"\b(\d{4,7})[-]?\d{0,3}\b",
 ]
 
+# 약학대학이 있는 대학교 (OCR 노이즈 보정용 표준 명칭)
+UNIVERSITY_NAMES = [
+    "서울대학교", "연세대학교", "고려대학교", "성균관대학교", "이화여자대학교", "중앙대학교",
+    "경희대학교", "숙명여자대학교", "덕성여자대학교", "동덕여자대학교", "삼육대학교",
+    "가톨릭대학교", "동국대학교", "한양대학교", "아주대학교", "차의과학대학교", "가천대학교",
+    "단국대학교", "강원대학교", "충북대학교", "충남대학교", "부산대학교", "경성대학교",
+    "인제대학교", "경상국립대학교", "영남대학교", "계명대학교", "대구가톨릭대학교",
+    "경북대학교", "전남대학교", "조선대학교", "목포대학교", "순천대학교", "우석대학교",
+    "원광대학교", "전북대학교", "제주대학교", "한림대학교", "고신대학교",
+]
+
+# 약학 키워드와 자모 몇 개 차이인 비약학 명칭 → 근사 매칭 시 이쪽이 더 가까우면 불인정
+KEYWORD_DISTRACTORS = [
+    "의학과", "의학대학", "의과대학", "한의학과", "한의과대학", "화학과", "수학과", "공학과",
+]
+
+# 대학명 앞에 붙어 읽히는 카드 문구 (extract_university_regex 에서 떼어냄)
+UNIVERSITY_NOISE_PREFIXES = ("학생증", "신분증", "학번", "성명", "소속")
+
+# 흔한 오인식 (근사 매칭 전에 먼저 치환)
+KNOWN_MISREADS = {
+    "약차과": "약학과", "약차대점": "약학대학", "양한대": "약학대학",
+    "약학과대": "약학과", "약학대": "약학대학", "약학대학학": "약학대학",
+}
+# correct_typos 가 근사 매칭으로 표준 표기로 되돌리는 어휘
+TYPO_CANONICAL = ("약학대학", "약학과")
+
+KEYWORD_INDEX = FuzzyIndex(
+    PHARMACY_KEYWORDS + STUDENT_CARD_KWS + sorted(LICENSE_REQUIRED_KWS) + sorted(LICENSE_NICE_KWS)
+    + UNIVERSITY_NAMES + KEYWORD_DISTRACTORS
+)
+
 NAME_STOPWORDS = {
     "학생증", "학번", "대학교", "대학", "학과", "단과대학", "학부", "총장", "교수",
     "School", "University", "UNIVERSITY", "College", "Department",
@@ -32,22 +74,49 @@ def visualize_save_path(image_path: str, suffix: str) -> str:
     base, ext = os.path.splitext(image_path)
     return f"{base}_{suffix}{ext}"
 
+@lru_cache(maxsize=256)
+def keyword_matches(text: str) -> Tuple[FuzzyMatch, ...]:
+    """
+    KEYWORD_INDEX 어휘의 (근사) 출현 위치, 원문 순서.
+    겹치는 매치는 더 가까운 쪽만 남기므로 '의학과'가 '약학과'로 인정되지 않음.
+    """
+    return tuple(select_matches(KEYWORD_INDEX.find(text)))
+
+def matched_keywords(text: str) -> FrozenSet[str]:
+    return frozenset(m.term for m in keyword_matches(text))
+
+def _pharmacy_fuzzy_ok(text: str, m: FuzzyMatch) -> bool:
+    """
+    약학 어휘 근사 매치 인정 조건 (영양학과→영약학과, 역학과→약학과 같은 오탐 방지):
+    - 단어 시작 (바로 앞 글자가 한글/영숫자가 아님)
+    - 첫 음절('약')은 정확히 읽힘 → 오인식은 뒤 음절에서만 허용
+    """
+    if m.dist == 0:
+        return True
+    if m.start > 0 and text[m.start - 1].isalnum():
+        return False
+    return text[m.start].lower() == m.term[0].lower()
+
 def correct_typos(text: str) -> str:
-    typo_map = {
-        "약차과": "약학과", "약차대점": "약학대학", "양한대": "약학대학",
-        "약학과대": "약학과", "약학대": "약학대학", "약학대학학": "약학대학",
-    }
-    for w, r in typo_map.items():
+    for w, r in KNOWN_MISREADS.items():
         text = text.replace(w, r)
+    # 근사 매칭으로 학과/대학 명칭을 표준 표기로 치환 (뒤에서부터 → 인덱스 유지)
+    for m in reversed(keyword_matches(text)):
+        if m.term in TYPO_CANONICAL and m.dist > 0 and _pharmacy_fuzzy_ok(text, m):
+            text = text[:m.start] + m.term + text[m.end:]
     return text
 
 def is_likely_student_card(text: str) -> bool:
     t = text.lower()
-    return any(k.lower() in t for k in STUDENT_CARD_KWS)
+    if any(k.lower() in t for k in STUDENT_CARD_KWS):
+        return True
+    return any(k in matched_keywords(text) for k in STUDENT_CARD_KWS)
 
 def has_pharmacy_major(text: str) -> bool:
     t = correct_typos(text)
-    return any(k.lower() in t.lower() for k in PHARMACY_KEYWORDS)
+    if any(k.lower() in t.lower() for k in PHARMACY_KEYWORDS):
+        return True
+    return any(m.term in PHARMACY_KEYWORDS and _pharmacy_fuzzy_ok(t, m) for m in keyword_matches(t))
 
 def merge_lines_by_y(sorted_boxes, y_thresh=15) -> List[str]:
     merged, current, prev_y = [], [], None
@@ -101,6 +170,14 @@ def extract_name_heuristic(text: str, lines: List[str]) -> str:
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored[0][0] if scored else ""
 
+def extract_name_from_region(text: str) -> str:
+    """레이아웃 템플릿 이름 영역 텍스트 → 첫 이름 후보 (성명/이름 라벨, 불용어 제외)."""
+    text = re.sub(r"(성명|이름)\s*[:：]?", " ", text)
+    for cand in _kname_candidates_from_line(text):
+        if not _is_bad_name_token(cand):
+            return cand
+    return ""
+
 def extract_student_id_regex(text: str) -> str:
     cleaned = (
         text.upper().replace(" ", "")
@@ -115,6 +192,29 @@ def extract_student_id_regex(text: str) -> str:
 
 def extract_university_regex(text: str) -> str:
     m = re.search(r"[가-힣]{2,10}대학교|[A-Z]{2,}\s+UNIVERSITY", text, re.IGNORECASE)
+    if m:
+        # 제대로 읽힌 '…대학교' 토큰은 다른 대학으로 바꾸지 않음 (경기→경희, 대구가톨릭→가톨릭 방지).
+        # 앞에 붙은 카드 문구만 떼어냄 (예: 학생증서울대학교 → 서울대학교)
+        name = m.group(0)
+        stripped = True
+        while stripped:
+            stripped = False
+            for prefix in UNIVERSITY_NOISE_PREFIXES:
+                if name.startswith(prefix) and len(name) - len(prefix) >= len("OO대학교"):
+                    name, stripped = name[len(prefix):], True
+        return name
+    # '대학교' 자체가 깨져 정규식이 실패한 경우만 등록된 대학명 근사 매칭 (예: 서울대학쿄 → 서울대학교)
+    for km in keyword_matches(text):
+        if km.term in UNIVERSITY_NAMES:
+            return km.term
+    return ""
+
+DEPARTMENT_PATTERN = r"[가-힣A-Za-z]{2,30}(학과|전공|학부|대학|대학원)"
+
+def extract_department_from_region(text: str) -> str:
+    """레이아웃 템플릿 학과 영역 텍스트 → 첫 학과/대학 명칭."""
+    # 영역에는 학과명만 있으므로 '약학과' 처럼 접미사 앞 1글자도 허용
+    m = re.search(r"[가-힣A-Za-z]{1,30}(학과|전공|학부|대학원|대학)", correct_typos(text))
     return m.group(0) if m else ""
 
 def extract_department_regex(text: str) -> str:
@@ -122,7 +222,7 @@ def extract_department_regex(text: str) -> str:
 
     # 1) 한글 후보 수집
     #    예) 약학과, 컴퓨터공학과, 경영학부, 약학대학, 약학대학원
-    cand_iter = re.finditer(r"[가-힣A-Za-z]{2,30}(학과|전공|학부|대학|대학원)", t)
+    cand_iter = re.finditer(DEPARTMENT_PATTERN, t)
     cands = [m.group(0) for m in cand_iter]
 
     def rank(dep: str) -> tuple:
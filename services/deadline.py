@@ -0,0 +1,81 @@
+# services/deadline.py
+import threading
+import time
+from typing import Dict, Optional
+
+class DeadlineExceeded(RuntimeError):
+    """요청 마감 시간 초과 또는 클라이언트 연결 종료로 작업이 중단됨."""
+
+# 프로세스 단위 카운터 (/ocr/stats 에서 노출)
+_stats_lock = threading.Lock()
+_STATS: Dict[str, int] = {"work_cancelled": 0, "clova_calls_avoided": 0, "clova_calls_abandoned": 0}
+
+def count(key: str, n: int = 1) -> None:
+    with _stats_lock:
+        _STATS[key] = _STATS.get(key, 0) + n
+
+def cancel_stats() -> Dict[str, int]:
+    with _stats_lock:
+        return dict(_STATS)
+
+class Deadline:
+    """
+    요청 단위 마감 시간 + 취소 플래그.
+    - 라우트가 생성해 validate_* → 방향 보정 → ClovaOCR 호출까지 전달
+    - 클라이언트 연결 종료 시 cancel() → 다음 check() 지점에서 DeadlineExceeded
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """timeout(초). None 이면 마감 없음, 0 이하면 이미 만료."""
+        self.expires_at = time.monotonic() + max(timeout, 0.0) if timeout is not None else None
+        self.reason = ""
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def from_header(cls, value: Optional[str], default_ms: int) -> "Deadline":
+        """
+        X-Deadline-Ms 헤더(호출자의 남은 시간 ms) 또는 기본값으로 생성.
+        - 헤더 0 이하: 호출자 예산이 이미 소진 → 즉시 만료 (첫 check() 에서 중단)
+        - 기본값(OCR_DEADLINE_MS) 0 이하: 마감 없음
+        """
+        try:
+            return cls(int(value) / 1000.0) if value else cls.from_ms(default_ms)
+        except ValueError:
+            return cls.from_ms(default_ms)
+
+    @classmethod
+    def from_ms(cls, ms: int) -> "Deadline":
+        """설정값(ms) → Deadline. 0 이하면 마감 없음."""
+        return cls(ms / 1000.0 if ms > 0 else None)
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초). 마감이 없으면 None."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._cancelled.is_set():
+            self.reason = reason
+            self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """취소되었거나 마감 시간이 지났으면 True."""
+        return self.cancelled or self.remaining() == 0.0
+
+    def check(self, stage: str, pending_calls: int = 0) -> None:
+        """
+        만료 시 DeadlineExceeded. pending_calls = 이 지점에서 중단되어
+        보내지 않게 된 Clova 호출 수 (clova_calls_avoided 카운터에 반영).
+        """
+        if not self.expired:
+            return
+        if pending_calls:
+            count("clova_calls_avoided", pending_calls)
+        reason = self.reason or "deadline exceeded"
+        raise DeadlineExceeded(f"{reason} ({stage})")
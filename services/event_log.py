@@ -0,0 +1,203 @@
+# services/event_log.py
+"""
+구조화 이벤트 로그 (요청 경로에서 I/O 없음).
+
+- emit() 은 메모리 링 버퍼에 dict 를 넣기만 하고, 백그라운드 스레드가 모아서 기록
+- 버퍼가 가득 차면 가장 오래된 이벤트를 버리고 dropped 로 집계
+- OCR_EVENT_LOG_PATH 확장자가 .sqlite / .db 면 SQLite(events 테이블), 그 외는 JSONL
+- 경로 미설정 시 비활성: 검증 이벤트는 버리고, 경고 이벤트만 기존처럼 print
+
+검증 1건당 한 줄 (wrap() 사용):
+    {"ts": ..., "event": "verification", "doc_type": "license", "outcome": "valid",
+     "stage_ms": {"orientation": 812.4, "ocr": 640.1, ...}, "clova_calls": 4,
+     "layout_template": "hit", "image_sha256": "...", "total_ms": 1470.2}
+이름/학번 등 추출 필드(PII)는 기록하지 않는다.
+"""
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+from services.deadline import DeadlineExceeded
+from services.ocr_replay import file_sha256
+from services.stages import collect
+
+EVENT_LOG_PATH = os.getenv("OCR_EVENT_LOG_PATH", "")
+# 링 버퍼 크기 / 배치 크기 / 최대 기록 주기(초)
+EVENT_BUFFER_SIZE = int(os.getenv("OCR_EVENT_BUFFER_SIZE", "10000"))
+EVENT_BATCH_SIZE = int(os.getenv("OCR_EVENT_BATCH_SIZE", "500"))
+EVENT_FLUSH_SEC = float(os.getenv("OCR_EVENT_FLUSH_SEC", "1.0"))
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+class EventLog:
+    def __init__(self, path: str, buffer_size: int = EVENT_BUFFER_SIZE,
+                 batch_size: int = EVENT_BATCH_SIZE, flush_sec: float = EVENT_FLUSH_SEC):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_sec = flush_sec
+        self._buf: Deque[Dict] = deque(maxlen=max(1, buffer_size))
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"emitted": 0, "dropped": 0, "written": 0, "write_errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def emit(self, event: str, **data) -> None:
+        """버퍼에 추가만 하고 즉시 반환 (블로킹 I/O 없음)."""
+        if not self.enabled:
+            return
+        data["ts"] = round(time.time(), 3)
+        data["event"] = event
+        with self._lock:
+            if len(self._buf) == self._buf.maxlen:
+                self.stats["dropped"] += 1
+            self._buf.append(data)
+            self.stats["emitted"] += 1
+            full_batch = len(self._buf) >= self.batch_size
+        if self._thread is None:
+            self._start()
+        if full_batch:
+            self._wake.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="ocr-event-writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _take_batch(self) -> List[Dict]:
+        with self._lock:
+            n = min(self.batch_size, len(self._buf))
+            return [self._buf.popleft() for _ in range(n)]
+
+    def _run(self) -> None:
+        try:
+            writer = _SQLiteSink(self.path) if self.path.endswith((".sqlite", ".db")) else _JsonlSink(self.path)
+        except Exception as e:
+            print(f"[⚠️ 이벤트 로그 열기 실패] {self.path}: {e}")
+            writer = _NullSink()
+        try:
+            while True:
+                self._wake.wait(self.flush_sec)
+                self._wake.clear()
+                stopping = self._stop.is_set()
+                while True:
+                    batch = self._take_batch()
+                    if not batch:
+                        break
+                    try:
+                        writer.write(batch)
+                        self.stats["written"] += len(batch)
+                    except Exception as e:
+                        # 기록 실패는 버리고 계속 (요청 경로에 영향 없음)
+                        self.stats["write_errors"] += len(batch)
+                        print(f"[⚠️ 이벤트 로그 기록 실패] {self.path}: {e}")
+                    if len(batch) < self.batch_size:
+                        break
+                if stopping:
+                    return
+        finally:
+            writer.close()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 이벤트를 기록하고 writer 스레드 종료 (프로세스 종료 시 자동 호출)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def status(self) -> Dict:
+        with self._lock:
+            buffered = len(self._buf)
+        return {"enabled": self.enabled, "path": self.path, "buffered": buffered, **self.stats}
+
+class _NullSink:
+    def write(self, batch: List[Dict]) -> None:
+        raise OSError("이벤트 로그 파일을 열 수 없습니다.")
+
+    def close(self) -> None:
+        pass
+
+class _JsonlSink:
+    def __init__(self, path: str):
+        self._f = open(path, "a", encoding="utf-8")
+
+    def write(self, batch: List[Dict]) -> None:
+        self._f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in batch))
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+class _SQLiteSink:
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+
+    def write(self, batch: List[Dict]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO events (ts, event, data) VALUES (?, ?, ?)",
+                [(e["ts"], e["event"], json.dumps(e, ensure_ascii=False)) for e in batch],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+event_log = EventLog(EVENT_LOG_PATH)
+
+def emit(event: str, **data) -> None:
+    event_log.emit(event, **data)
+
+def warn(event: str, message: str, **data) -> None:
+    """경고 이벤트. 이벤트 로그가 꺼져 있으면 기존처럼 print."""
+    if event_log.enabled:
+        event_log.emit(event, level="warning", message=message, **data)
+    else:
+        print(f"[⚠️ {message}] " + ", ".join(f"{k}={v}" for k, v in data.items()))
+
+def wrap(fn: Callable[..., Dict], doc_type: str) -> Callable[..., Dict]:
+    """검증 함수를 감싸 검증 1건당 verification 이벤트 1개를 남긴다 (스레드풀 워커에서 실행)."""
+    if not event_log.enabled:
+        return fn
+
+    def wrapper(image_path: str, *args, **kwargs) -> Dict:
+        t0 = time.perf_counter()
+        sha = file_sha256(image_path)
+        outcome, layout = "error", None
+        with collect() as st:
+            try:
+                result = fn(image_path, *args, **kwargs)
+                outcome = "valid" if result.get("valid") else "invalid"
+                layout = result.get("layout_template")
+                return result
+            except DeadlineExceeded:
+                outcome = "cancelled"
+                raise
+            finally:
+                emit(
+                    "verification", doc_type=doc_type, outcome=outcome, stage_ms=st.as_ms(),
+                    clova_calls=st.clova_calls, layout_template=layout, image_sha256=sha,
+                    total_ms=round((time.perf_counter() - t0) * 1000, 2),
+                )
+    return wrapper
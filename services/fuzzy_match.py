@@ -0,0 +1,184 @@
+# services/fuzzy_match.py
+"""
+OCR 노이즈에 강한 키워드 근사 매칭.
+
+- 한글은 자모 단위(초/중/종성)로 분해해 편집 거리를 잰다
+  (예: 약학과 ↔ 약학괴 = 자모 1개 차이)
+- 어휘 전체의 자모 3-gram 역색인을 미리 만들어 두고, 텍스트의 각 3-gram 이
+  가리키는 (어휘, 시작 위치) 후보만 투표 → 임계 이상인 곳만 편집 거리 검증
+  → 텍스트 길이에 대략 선형
+- 공백은 무시 (OCR 박스 병합 시 '약학 대학' 처럼 끊어지는 경우)
+"""
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = (
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+
+def jamo(ch: str) -> str:
+    """한글 음절 1자 → 자모 문자열. 그 외 문자는 소문자로 그대로."""
+    if "가" <= ch <= "힣":
+        code = ord(ch) - 0xAC00
+        return _CHO[code // 588] + _JUNG[(code % 588) // 28] + _JONG[code % 28]
+    return ch.lower()
+
+def to_jamo(s: str) -> str:
+    return "".join(jamo(ch) for ch in s if not ch.isspace())
+
+def max_distance(jamo_len: int) -> int:
+    """
+    어휘 길이별 허용 편집 거리. 짧은 단어는 정확 일치만 (약학/약한 같은 오탐 방지).
+    """
+    if jamo_len < 7:
+        return 0
+    if jamo_len < 10:
+        return 1
+    return 2
+
+def prefix_distances(a: str, b: str, k: int) -> List[int]:
+    """
+    a 와 b 의 각 접두어 b[:j] 사이 편집 거리 목록 (k 초과는 k + 1).
+    대각선 ±k 띠만 계산하고, 모든 값이 k 를 넘으면 조기 종료.
+    """
+    lb = len(b)
+    inf = k + 1
+    prev = [j if j <= k else inf for j in range(lb + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [inf] * (lb + 1)
+        if i <= k:
+            cur[0] = i
+        row_min = cur[0]
+        ca = a[i - 1]
+        for j in range(max(1, i - k), min(lb, i + k) + 1):
+            v = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < v:
+                v = prev[j] + 1
+            if cur[j - 1] + 1 < v:
+                v = cur[j - 1] + 1
+            cur[j] = v if v < inf else inf
+            if v < row_min:
+                row_min = v
+        if row_min > k:
+            return [inf] * (lb + 1)
+        prev = cur
+    return prev
+
+def bounded_levenshtein(a: str, b: str, k: int) -> int:
+    """편집 거리 (k 초과 시 k + 1 반환)."""
+    if abs(len(a) - len(b)) > k:
+        return k + 1
+    return prefix_distances(a, b, k)[len(b)]
+
+class FuzzyMatch(NamedTuple):
+    term: str   # 어휘 원형
+    start: int  # 원문 문자 인덱스 (포함)
+    end: int    # 원문 문자 인덱스 (미포함)
+    dist: int   # 자모 편집 거리
+
+class FuzzyIndex:
+    """
+    어휘 집합에 대한 자모 3-gram 역색인.
+    find(text) → 어휘별 근사 출현 위치 (겹침 해소 전 전체 목록)
+    """
+
+    Q = 3
+
+    def __init__(self, vocab: Iterable[str]):
+        self.terms: List[str] = []
+        self._jamo: List[str] = []
+        self._k: List[int] = []
+        self._min_votes: List[int] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for term in dict.fromkeys(vocab):
+            tj = to_jamo(term)
+            if not tj:
+                continue
+            tid = len(self.terms)
+            self.terms.append(term)
+            self._jamo.append(tj)
+            k = max_distance(len(tj))
+            self._k.append(k)
+            # q-gram 보조정리: 편집 k회 이내 일치면 공유 q-gram ≥ (L - q + 1) - q*k
+            self._min_votes.append(max(1, (len(tj) - self.Q + 1) - self.Q * k))
+            for off in range(max(1, len(tj) - self.Q + 1)):
+                self._postings[tj[off:off + self.Q]].append((tid, off))
+
+    def find(self, text: str) -> List[FuzzyMatch]:
+        # 공백 제외 자모열 + 자모 위치 → 원문 문자 인덱스 매핑
+        js: List[str] = []
+        char_of: List[int] = []
+        starts: Dict[int, int] = {}  # 자모 시작 위치 → 원문 문자 인덱스
+        for ci, ch in enumerate(text):
+            if ch.isspace():
+                continue
+            starts[len(js)] = ci
+            for j in jamo(ch):
+                js.append(j)
+                char_of.append(ci)
+        J = "".join(js)
+        n = len(J)
+        if not n:
+            return []
+
+        # 1) 투표: (어휘, 추정 시작 위치)
+        votes: Counter = Counter()
+        for p in range(max(1, n - self.Q + 1)):
+            for tid, off in self._postings.get(J[p:p + self.Q], ()):
+                votes[(tid, p - off)] += 1
+
+        # 2) ±k 범위 합산이 임계 이상인 후보만 검증
+        found: Dict[Tuple[int, int, int], int] = {}
+        checked = set()
+        for (tid, s0), _ in votes.items():
+            k = self._k[tid]
+            total = votes[(tid, s0)]
+            for d in range(1, k + 1):
+                total += votes.get((tid, s0 - d), 0) + votes.get((tid, s0 + d), 0)
+            if total < self._min_votes[tid]:
+                continue
+            tj = self._jamo[tid]
+            for s in range(max(0, s0 - k), min(n, s0 + k + 1)):
+                if s not in starts or (tid, s) in checked:
+                    continue
+                checked.add((tid, s))
+                self._verify(tid, tj, k, J, s, starts, char_of, found)
+
+        return [FuzzyMatch(self.terms[t], a, b, d) for (t, a, b), d in found.items()]
+
+    def _verify(self, tid, tj, k, J, s, starts, char_of, found) -> None:
+        """s 에서 시작해 음절 경계에서 끝나는 구간들의 편집 거리를 DP 한 번으로 계산."""
+        L = len(tj)
+        seg = J[s:s + L + k]
+        dists = prefix_distances(tj, seg, k)
+        for ln in range(max(1, L - k), len(seg) + 1):
+            e = s + ln
+            d = dists[ln]
+            if d > k or (e < len(J) and e not in starts):
+                continue
+            key = (tid, starts[s], char_of[e - 1] + 1)
+            if d < found.get(key, k + 1):
+                found[key] = d
+
+def _match_rank(m: FuzzyMatch) -> Tuple[int, int, int]:
+    # 일치 자모 수 (길이 - 2*거리) 큰 것 → 긴 어휘 → 앞쪽 위치
+    L = len(to_jamo(m.term))
+    return (2 * m.dist - L, -L, m.start)
+
+def select_matches(matches: Iterable[FuzzyMatch]) -> List[FuzzyMatch]:
+    """
+    겹치는 매치 중 일치 자모가 많은 쪽(동률이면 긴 어휘)을 골라 겹침 없는 목록 반환.
+    예) '약학괴' → 약학(0) 대신 약학과(1), '의학대학' → 약학대학(2) 대신 의학대학(0)
+    """
+    taken: List[Tuple[int, int]] = []
+    out: List[FuzzyMatch] = []
+    for m in sorted(matches, key=_match_rank):
+        if any(m.start < b and a < m.end for a, b in taken):
+            continue
+        taken.append((m.start, m.end))
+        out.append(m)
+    out.sort(key=lambda m: m.start)
+    return out
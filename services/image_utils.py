@@ -1,9 +1,18 @@
 # services/image_utils.py
 from PIL import Image, ImageOps
-from typing import Tuple, List
+from typing import Callable, Optional, Tuple, List
 import os
 import tempfile
 
+from services.deadline import Deadline, DeadlineExceeded, count
+
+# 방향 판정용 프로브 썸네일 설정 (긴 변 px, JPEG 품질). 0이면 원본 해상도로 판정.
+PROBE_LONG_SIDE = int(os.getenv("OCR_PROBE_LONG_SIDE", "960"))
+PROBE_QUALITY = int(os.getenv("OCR_PROBE_QUALITY", "70"))
+
+# 후보 회전각(PIL rotate 인자): 0, 시계방향 90, 반시계방향 90
+_ROTATIONS = (0, -90, 90)
+
 # ------------------------
 # 공통: 이미지/회전 유틸
 # ------------------------
@@ -28,37 +37,94 @@ def rotate90(path: str, cw: bool) -> str:
     img = img.rotate(-90 if cw else 90, expand=True)
     return _save_tmp(img, os.path.splitext(path)[1] or ".jpg")
 
+def _save_probe(img: Image.Image) -> str:
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
+    img.save(tmp.name, format="JPEG", quality=PROBE_QUALITY, optimize=True)
+    return tmp.name
+
+def make_probe(img: Image.Image, long_side: int = PROBE_LONG_SIDE) -> Image.Image:
+    """방향 판정 전용 그레이스케일 썸네일 (긴 변 long_side 이하)."""
+    probe = img.convert("L")
+    probe.thumbnail((long_side, long_side))
+    return probe
+
+def _best_rotation(
+    img: Image.Image,
+    ocr_lines_fn,
+    score_fn: Callable[[str, int, int], Tuple],
+    probe_long_side: Optional[int] = PROBE_LONG_SIDE,
+    ext: str = ".jpg",
+    deadline: Optional[Deadline] = None,
+) -> int:
+    """
+    0/±90도 후보를 OCR 점수로 비교해 최적 회전각(PIL rotate 인자) 반환.
+    - probe_long_side > 0: 저해상도 그레이스케일 썸네일만 OCR (점수 산정용)
+    - probe_long_side 0/None: 원본 해상도 후보를 그대로 OCR (기존 방식)
+    동점이면 앞선 후보(0도)를 유지. 후보 임시 파일은 모두 정리.
+    deadline 만료 시 남은 후보(+최종 OCR)를 보내지 않고 DeadlineExceeded.
+    """
+    if probe_long_side:
+        base, save = make_probe(img, probe_long_side), _save_probe
+    else:
+        base, save = img, (lambda im: _save_tmp(im, ext))
+
+    best_angle, best_score = 0, None
+    for i, angle in enumerate(_ROTATIONS):
+        if deadline is not None:
+            deadline.check("orientation", pending_calls=len(_ROTATIONS) - i + 1)
+        cand = base.rotate(angle, expand=True) if angle else base
+        p = save(cand)
+        try:
+            lines = ocr_lines_fn(p, conf_min=0.6)
+            w, h = cand.size
+            score = score_fn(" ".join(lines), w, h)
+        except DeadlineExceeded:
+            # 이 후보 호출은 ClovaOCR 가 집계 → 뒤에 남은 후보 + 최종 OCR 만 추가
+            count("clova_calls_avoided", len(_ROTATIONS) - i)
+            raise
+        except Exception:
+            score = None
+        finally:
+            try:
+                if os.path.exists(p): os.unlink(p)
+            except Exception:
+                pass
+        if score is not None and (best_score is None or score > best_score):
+            best_angle, best_score = angle, score
+    return best_angle
+
+def _save_rotated(img: Image.Image, angle: int, ext: str) -> str:
+    """선택된 방향만 원본 화질로 저장."""
+    if angle:
+        img = img.rotate(angle, expand=True)
+    return _save_tmp(img, ext)
+
 # ------------------------
 # 면허증 전용: 자동 방향 보정
 # ------------------------
 _LICENSE_KWS = ("면허증", "보건복지부", "약사법", "제3조", "장관")
 
-def ensure_upright_for_license(path: str, ocr_lines_fn) -> str:
+def _license_score(text: str, w: int, h: int) -> Tuple[int, int]:
+    kw = sum(1 for k in _LICENSE_KWS if k in text)
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
+    return (kw, hangul)
+
+def ensure_upright_for_license(
+    path: str,
+    ocr_lines_fn,
+    probe_long_side: Optional[int] = PROBE_LONG_SIDE,
+    deadline: Optional[Deadline] = None,
+) -> str:
     """
     면허증 입력을 0/±90도 중 가장 '읽기 좋은' 방향으로 보정.
     ocr_lines_fn = ClovaOCR.ocr_lines (image_path, conf_min=...)
+    - 후보 점수는 프로브 썸네일로 산정 (probe_long_side=0 이면 원본 해상도)
+    - 최적 방향만 원본 화질로 저장해 경로 반환
     """
-    fixed = autorotate_exif(path)
-    cands = [fixed, rotate90(fixed, cw=True), rotate90(fixed, cw=False)]
-    scored = []
-    for p in cands:
-        try:
-            lines = ocr_lines_fn(p, conf_min=0.6)
-            text = " ".join(lines)
-            kw = sum(1 for k in _LICENSE_KWS if k in text)
-            hangul = sum(1 for ch in text if "가" <= ch <= "힣")
-            scored.append((kw, hangul, p))
-        except Exception:
-            scored.append((0, 0, p))
-    scored.sort(reverse=True)  # (kw, hangul) 내림차순
-    best = scored[0][2]
-    # 나머지 임시 파일 정리
-    for _, _, p in scored[1:]:
-        try:
-            if os.path.exists(p): os.unlink(p)
-        except Exception:
-            pass
-    return best
+    ext = os.path.splitext(path)[1] or ".jpg"
+    img = _open_exif_transposed(path)
+    angle = _best_rotation(img, ocr_lines_fn, _license_score, probe_long_side, ext, deadline)
+    return _save_rotated(img, angle, ext)
 
 # ------------------------
 # 학생증 전용: 카드 형태 판단
@@ -122,50 +188,33 @@ def is_card_like(image_path: str, ocr_result) -> bool:
 
 _STUDENT_KWS = ("학생증", "학번", "대학교", "STUDENT", "STUDENT ID", "UNIVERSITY", "DEPARTMENT", "학과")
 
-def ensure_landscape_for_student(path: str, ocr_lines_fn) -> str:
-    """
-    학생증 입력을 0/±90도 중 가장 '읽기 좋은(=가로형 선호)' 방향으로 보정.
-    - EXIF 보정 후 3가지 후보(0, +90, -90) 생성
-    - 학생증 키워드 개수, 한글량, 가로형 여부, 카드 비율을 기준으로 스코어링
-    - 최적 후보 파일 경로를 반환 (선택되지 않은 임시 파일은 정리)
-    """
-    fixed = autorotate_exif(path)
-    cands = [fixed, rotate90(fixed, cw=True), rotate90(fixed, cw=False)]
-    scored = []
+def _student_score(text: str, w: int, h: int) -> float:
+    kw = sum(1 for k in _STUDENT_KWS if k.lower() in text.lower())
+    hangul = sum(1 for ch in text if "가" <= ch <= "힣")
 
-    for p in cands:
-        try:
-            with _open_exif_transposed(p) as img:
-                w, h = img.size
-            # OCR 라인 추출(신뢰도 하한 살짝 둠)
-            lines = ocr_lines_fn(p, conf_min=0.6)
-            text = " ".join(lines)
+    # 가로형 보너스
+    landscape_bonus = 1 if w >= h else 0
 
-            kw = sum(1 for k in _STUDENT_KWS if k.lower() in text.lower())
-            hangul = sum(1 for ch in text if "가" <= ch <= "힣")
-
-            # 가로형 보너스
-            landscape_bonus = 1 if w >= h else 0
-
-            # 카드 비율 보너스 (대략 1.3~2.2가 카드형)
-            ratio = card_aspect_ratio(p)
-            ratio_bonus = 1 if 1.2 <= ratio <= 2.5 else 0
-
-            # 최종 스코어(가중치는 경험적)
-            score = (kw * 3) + (hangul * 0.01) + (landscape_bonus * 2) + ratio_bonus
-            scored.append((score, p))
-        except Exception:
-            scored.append((0, p))
+    # 카드 비율 보너스 (대략 1.3~2.2가 카드형)
+    ratio = max(w, h) / max(1, min(w, h))
+    ratio_bonus = 1 if 1.2 <= ratio <= 2.5 else 0
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    best_path = scored[0][1]
+    # 최종 스코어(가중치는 경험적)
+    return (kw * 3) + (hangul * 0.01) + (landscape_bonus * 2) + ratio_bonus
 
-    # 선택되지 않은 후보 임시파일 정리
-    for _, p in scored[1:]:
-        try:
-            if os.path.exists(p):
-                os.unlink(p)
-        except Exception:
-            pass
-
-    return best_path
\ No newline at end of file
+def ensure_landscape_for_student(
+    path: str,
+    ocr_lines_fn,
+    probe_long_side: Optional[int] = PROBE_LONG_SIDE,
+    deadline: Optional[Deadline] = None,
+) -> str:
+    """
+    학생증 입력을 0/±90도 중 가장 '읽기 좋은(=가로형 선호)' 방향으로 보정.
+    - EXIF 보정 후 3가지 후보(0, +90, -90)를 프로브 썸네일로 OCR
+    - 학생증 키워드 개수, 한글량, 가로형 여부, 카드 비율을 기준으로 스코어링
+    - 최적 방향만 원본 화질로 저장해 경로 반환 (probe_long_side=0 이면 원본 해상도로 판정)
+    """
+    ext = os.path.splitext(path)[1] or ".jpg"
+    img = _open_exif_transposed(path)
+    angle = _best_rotation(img, ocr_lines_fn, _student_score, probe_long_side, ext, deadline)
+    return _save_rotated(img, angle, ext)
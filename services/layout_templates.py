@@ -0,0 +1,137 @@
+# services/layout_templates.py
+"""
+기관별 레이아웃 템플릿: 알려진 필드 영역의 OCR 박스를 바로 읽어 휴리스틱 추출을 건너뜀.
+
+- 템플릿 파일: OCR_LAYOUT_TEMPLATES (JSON, 기본 layout_templates.json). 없으면 항상 미적중 → 기존 휴리스틱
+- 키: "student:<대학명>" (extract_university_regex 결과) / "license" (면허증 양식 확인 시)
+- 좌표: OCR 박스 전체 외곽(텍스트 영역)을 0~1 로 정규화한 [x0, y0, x1, y1]. 박스 중심이 영역 안이면 해당 필드
+    {
+      "student:서울대학교": {"samples": 42, "fields": {"name": [0.05, 0.48, 0.45, 0.62], ...}},
+      "license": {"samples": 130, "fields": {"licenseNumber": [...], "issueDate": [...], "name": [...]}}
+    }
+- 템플릿은 scripts/build_layout_templates.py 로 기록된 Clova 응답(ocr_replay)에서 생성
+- 영역 텍스트는 필드별 파서(검증 모듈이 제공)로 검사하고, 실패한 필드만 휴리스틱으로 추출
+"""
+import json
+import os
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from services import event_log
+
+LAYOUT_TEMPLATES_PATH = os.getenv("OCR_LAYOUT_TEMPLATES", "layout_templates.json")
+# 공간 인덱스 격자 크기 (GRID x GRID)
+GRID = 8
+
+Region = Tuple[float, float, float, float]
+
+def template_key(doc_type: str, institution: str = "") -> str:
+    return f"{doc_type}:{institution}" if institution else doc_type
+
+def load_templates(path: str) -> Dict[str, Dict]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        event_log.warn("layout_templates_load_failed", "레이아웃 템플릿 로드 실패", path=path, error=str(e))
+        return {}
+
+TEMPLATES: Dict[str, Dict] = load_templates(LAYOUT_TEMPLATES_PATH)
+
+class BoxIndex:
+    """
+    OCR 박스 중심점의 격자 인덱스. 좌표는 박스 전체 외곽 기준 0~1 로 정규화.
+    boxes: Paddle 형식 [[bbox4], (text, conf)] 목록
+    """
+
+    def __init__(self, boxes: Sequence, grid: int = GRID):
+        self.grid = grid
+        self.items: List[Tuple[float, float, str]] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        if not boxes:
+            return
+        xs = [p[0] for b in boxes for p in b[0]]
+        ys = [p[1] for b in boxes for p in b[0]]
+        self.x0, self.y0 = min(xs), min(ys)
+        self.w, self.h = max(max(xs) - self.x0, 1e-6), max(max(ys) - self.y0, 1e-6)
+        for i, b in enumerate(boxes):
+            rx0, ry0, rx1, ry1 = self.normalize(b[0])
+            cx, cy = (rx0 + rx1) / 2, (ry0 + ry1) / 2
+            self.items.append((cx, cy, b[1][0]))
+            self.cells.setdefault(self._cell(cx, cy), []).append(i)
+
+    def normalize(self, bbox) -> Region:
+        """박스 꼭짓점 → 정규화 외접 사각형."""
+        xs = [(p[0] - self.x0) / self.w for p in bbox]
+        ys = [(p[1] - self.y0) / self.h for p in bbox]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        g = self.grid
+        return min(g - 1, max(0, int(x * g))), min(g - 1, max(0, int(y * g)))
+
+    def query(self, region: Region) -> List[str]:
+        """중심이 region 안에 있는 박스 텍스트 (위→아래, 왼→오른)."""
+        if not self.items:
+            return []
+        x0, y0, x1, y1 = region
+        (gx0, gy0), (gx1, gy1) = self._cell(x0, y0), self._cell(x1, y1)
+        hits = []
+        for gx in range(gx0, gx1 + 1):
+            for gy in range(gy0, gy1 + 1):
+                for i in self.cells.get((gx, gy), ()):
+                    cx, cy, text = self.items[i]
+                    if x0 <= cx <= x1 and y0 <= cy <= y1:
+                        hits.append((cy, cx, text))
+        return [t for _, _, t in sorted(hits)]
+
+# ------------------------
+# 적중률 통계 (/ocr/stats)
+# ------------------------
+_STATS: Counter = Counter()
+_stats_lock = threading.Lock()
+
+def _count(**deltas: int) -> None:
+    with _stats_lock:
+        _STATS.update(deltas)
+
+def layout_stats() -> Dict:
+    with _stats_lock:
+        s = dict(_STATS)
+    lookups = s.get("hit", 0) + s.get("partial", 0) + s.get("miss", 0)
+    fields = s.get("fields_template", 0) + s.get("fields_heuristic", 0)
+    return {
+        **s,
+        "templates": len(TEMPLATES),
+        "hit_rate": round(s.get("hit", 0) / lookups, 4) if lookups else 0.0,
+        "field_hit_rate": round(s.get("fields_template", 0) / fields, 4) if fields else 0.0,
+    }
+
+def read_fields(
+    key: str, boxes: Sequence, parsers: Dict[str, Callable[[str], str]],
+    templates: Optional[Dict[str, Dict]] = None,
+) -> Tuple[Dict[str, str], str]:
+    """
+    템플릿 영역에서 필드 읽기.
+    반환: (찾은 필드, 상태) — 상태는 hit(전부) / partial / miss(템플릿 있으나 0개) / none(템플릿 없음)
+    parsers 중 찾지 못한 필드는 호출부가 휴리스틱으로 채운다.
+    """
+    tpl = (TEMPLATES if templates is None else templates).get(key)
+    if not tpl:
+        _count(none=1, fields_heuristic=len(parsers))
+        return {}, "none"
+    index = BoxIndex(boxes)
+    found: Dict[str, str] = {}
+    for name, region in (tpl.get("fields") or {}).items():
+        parse = parsers.get(name)
+        if parse is None:
+            continue
+        value = parse(" ".join(index.query(region)))
+        if value:
+            found[name] = value
+    status = "hit" if len(found) == len(parsers) else "partial" if found else "miss"
+    _count(**{status: 1, "fields_template": len(found), "fields_heuristic": len(parsers) - len(found)})
+    return found, status
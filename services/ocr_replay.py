@@ -0,0 +1,376 @@
+# services/ocr_replay.py
+"""
+Clova 응답 기록/재생.
+
+- 기록: OCR_RECORD_PATH(SQLite 파일) 설정 시 common_ocr 가 clova_ocr.recorder 를 붙이고,
+  라우트가 검증 함수를 recorder.wrap() 으로 감싼다.
+  검증 1건마다 입력 이미지 해시, 검증 결과(valid/fields/단계별 시간), 그 안의 Clova 호출
+  (요청 메타데이터 + 이미지 해시 + 원본 응답 JSON, zlib 압축)을 저장.
+  입력 이미지 원본은 OCR_RECORD_IMAGES=1 일 때만 저장 (재생에 필요).
+  ※ 이 경우 신분증 이미지가 암호화 없이 저장되므로 접근이 통제된 경로에서만 사용할 것.
+- 재생: replay(store) 가 clova_ocr.replayer 를 붙여 네트워크 없이 같은 검증을 다시 실행하고
+  처리량/단계별 시간과 valid·fields 변화를 보고 (benchmarks/replay_clova.py).
+  응답은 (이미지 해시, lang, templateIds) 로 찾고, 전처리 변경 등으로 해시가 달라지면
+  같은 검증 안의 같은 순번 호출로 대체한다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.stages import collect
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    sha256 TEXT PRIMARY KEY,
+    ext TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    doc_type TEXT NOT NULL,
+    image_sha256 TEXT NOT NULL,
+    valid INTEGER,
+    fields TEXT,
+    stage_ms TEXT,
+    error TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS clova_calls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    verification_id INTEGER,
+    seq INTEGER NOT NULL,
+    image_sha256 TEXT NOT NULL,
+    lang TEXT,
+    template_ids TEXT,
+    request TEXT NOT NULL,
+    latency_ms REAL,
+    response BLOB NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_calls_lookup ON clova_calls (image_sha256, lang, template_ids);
+CREATE INDEX IF NOT EXISTS idx_calls_verification ON clova_calls (verification_id, seq);
+"""
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _pack(obj: Dict) -> bytes:
+    return zlib.compress(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def _unpack(blob: bytes) -> Dict:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+def _templates_key(template_ids) -> str:
+    return json.dumps(sorted(template_ids)) if template_ids else ""
+
+class ClovaStore:
+    """기록 저장소 (SQLite 단일 파일). 스레드 간 공유 가능."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        # 여러 프로세스(scripts/bulk_verify.py)가 같은 파일에 쓸 수 있도록 WAL + 대기
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def put_image(self, data: bytes, ext: str) -> str:
+        sha = hashlib.sha256(data).hexdigest()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO images VALUES (?, ?, ?)", (sha, ext, data))
+        return sha
+
+    def latest_verification(self, image_sha: str, doc_type: str) -> Optional[int]:
+        """해당 이미지/문서 유형의 가장 최근 정상 완료 검증 id."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM verifications WHERE image_sha256 = ? AND doc_type = ? AND valid IS NOT NULL"
+                " ORDER BY id DESC LIMIT 1",
+                (image_sha, doc_type),
+            ).fetchone()
+        return row[0] if row else None
+
+    def image(self, sha: str) -> Tuple[bytes, str]:
+        with self._lock:
+            row = self._conn.execute("SELECT data, ext FROM images WHERE sha256 = ?", (sha,)).fetchone()
+        if row is None:
+            raise KeyError(sha)
+        return row[0], row[1]
+
+    def start_verification(self, doc_type: str, image_sha: str) -> int:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO verifications (doc_type, image_sha256, recorded_at) VALUES (?, ?, ?)",
+                (doc_type, image_sha, time.time()),
+            )
+        return cur.lastrowid
+
+    def finish_verification(
+        self, vid: int, result: Optional[Dict], stage_ms: Dict[str, float], error: str = "",
+    ) -> None:
+        valid = None if result is None else int(bool(result.get("valid")))
+        fields = None if result is None else json.dumps(result.get("fields") or {}, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE verifications SET valid = ?, fields = ?, stage_ms = ?, error = ? WHERE id = ?",
+                (valid, fields, json.dumps(stage_ms), error or None, vid),
+            )
+
+    def add_call(
+        self, vid: Optional[int], seq: int, image_sha: str, request_json: Dict, response: Dict, latency: float,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO clova_calls (verification_id, seq, image_sha256, lang, template_ids, request,"
+                " latency_ms, response, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    vid, seq, image_sha, request_json.get("lang") or "",
+                    _templates_key(request_json.get("templateIds")),
+                    json.dumps(request_json, ensure_ascii=False), round(latency * 1000, 2),
+                    _pack(response), time.time(),
+                ),
+            )
+
+    def find_response(self, image_sha: str, lang: Optional[str], template_ids) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM clova_calls WHERE image_sha256 = ? AND lang = ? AND template_ids = ?"
+                " ORDER BY id DESC LIMIT 1",
+                (image_sha, lang or "", _templates_key(template_ids)),
+            ).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def calls_for(self, vid: int) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT response FROM clova_calls WHERE verification_id = ? ORDER BY seq", (vid,),
+            ).fetchall()
+        return [_unpack(r[0]) for r in rows]
+
+    def verifications(self, doc_type: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """정상 완료된 검증 기록 (오류로 끝난 건 제외)."""
+        sql = "SELECT id, doc_type, image_sha256, valid, fields, stage_ms FROM verifications WHERE valid IS NOT NULL"
+        args: list = []
+        if doc_type:
+            sql += " AND doc_type = ?"
+            args.append(doc_type)
+        sql += " ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [
+            {
+                "id": r[0], "doc_type": r[1], "image_sha256": r[2], "valid": bool(r[3]),
+                "fields": json.loads(r[4] or "{}"), "stage_ms": json.loads(r[5] or "{}"),
+            }
+            for r in rows
+        ]
+
+class _Session:
+    """검증 1건 안의 Clova 호출 순번 (재생 시에는 기록된 응답 목록 포함)."""
+
+    def __init__(self, vid: Optional[int], calls: Optional[List[Dict]] = None):
+        self.vid = vid
+        self.calls = calls or []
+        self.seq = 0
+
+    def next_seq(self) -> int:
+        seq = self.seq
+        self.seq += 1
+        return seq
+
+_session: ContextVar[Optional[_Session]] = ContextVar("clova_replay_session", default=None)
+
+def _warn_record_failed(image_path: str, e: Exception) -> None:
+    # event_log 가 이 모듈(file_sha256)을 import 하므로 지연 import
+    from services import event_log
+    event_log.warn("clova_record_failed", "Clova 응답 기록 실패", path=image_path, error=str(e))
+
+class ClovaRecorder:
+    """
+    ClovaOCR.recorder 로 붙여 쓰는 기록기.
+    기본은 입력 이미지 해시만 남긴다. keep_images=True 면 원본도 저장 (replay 로 재실행할 때 필요).
+    """
+
+    def __init__(self, store: ClovaStore, keep_images: bool = False):
+        self.store = store
+        self.keep_images = keep_images
+
+    def wrap(self, fn: Callable[..., Dict], doc_type: str) -> Callable[..., Dict]:
+        """검증 함수를 감싸 입력 이미지/결과/단계별 시간을 기록 (스레드풀 워커에서 실행)."""
+
+        def wrapper(image_path: str, *args, **kwargs) -> Dict:
+            # 기록 실패(SQLite 잠금, 디스크 부족 등)가 검증 실패로 이어지지 않도록: 기록 없이 진행
+            try:
+                vid = self._start(image_path, doc_type)
+            except Exception as e:
+                _warn_record_failed(image_path, e)
+                return fn(image_path, *args, **kwargs)
+            token = _session.set(_Session(vid))
+            try:
+                with collect() as st:
+                    try:
+                        result = fn(image_path, *args, **kwargs)
+                    except Exception as e:
+                        self._finish(image_path, vid, None, st.as_ms(), error=repr(e))
+                        raise
+                self._finish(image_path, vid, result, st.as_ms())
+                return result
+            finally:
+                _session.reset(token)
+        return wrapper
+
+    def _start(self, image_path: str, doc_type: str) -> int:
+        if self.keep_images:
+            with open(image_path, "rb") as f:
+                sha = self.store.put_image(f.read(), os.path.splitext(image_path)[1] or ".jpg")
+        else:
+            sha = file_sha256(image_path)
+        return self.store.start_verification(doc_type, sha)
+
+    def _finish(self, image_path: str, vid: int, result: Optional[Dict], stage_ms: Dict[str, float], error: str = "") -> None:
+        try:
+            self.store.finish_verification(vid, result, stage_ms, error=error)
+        except Exception as e:
+            _warn_record_failed(image_path, e)
+
+    def record_call(self, image_path: str, request_json: Dict, response: Dict, latency: float) -> None:
+        # 기록 실패가 요청 실패로 이어지지 않도록
+        try:
+            sess = _session.get()
+            seq = sess.next_seq() if sess is not None else 0
+            self.store.add_call(
+                sess.vid if sess is not None else None, seq, file_sha256(image_path), request_json, response, latency,
+            )
+        except Exception as e:
+            _warn_record_failed(image_path, e)
+
+class ReplaySource:
+    """ClovaOCR.replayer 로 붙여 쓰는 재생기. 네트워크 호출 없음."""
+
+    def __init__(self, store: ClovaStore):
+        self.store = store
+        self.stats: Counter = Counter()
+
+    def lookup(self, image_path: str, request_json: Dict) -> Dict:
+        sess = _session.get()
+        seq = sess.next_seq() if sess is not None else -1
+        raw = self.store.find_response(file_sha256(image_path), request_json.get("lang"), request_json.get("templateIds"))
+        if raw is not None:
+            self.stats["hit"] += 1
+            return raw
+        if sess is not None and 0 <= seq < len(sess.calls):
+            self.stats["sequence_fallback"] += 1
+            return sess.calls[seq]
+        self.stats["miss"] += 1
+        raise RuntimeError(f"재생 기록 없음: {os.path.basename(image_path)}")
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+def replay(store: ClovaStore, doc_type: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+    """
+    기록된 검증을 네트워크 없이 다시 실행.
+    반환: 처리량, 단계별 시간(ms, 평균/p95), 조회 통계, valid/fields 변화 목록, 오류 목록
+    """
+    from services.common_ocr import clova_ocr
+    from services.verify_license import validate_license_document
+    from services.verify_student import validate_student_card
+    validators = {"student": validate_student_card, "license": validate_license_document}
+
+    source = ReplaySource(store)
+    prev, clova_ocr.replayer = clova_ocr.replayer, source
+    # 재생 중에는 시각화 파일을 만들지 않음 (단계별 시간에서도 제외)
+    prev_visualize = os.environ.get("OCR_VISUALIZE")
+    os.environ["OCR_VISUALIZE"] = "0"
+    stage_samples: Dict[str, List[float]] = {}
+    changes: List[Dict] = []
+    errors: List[Dict] = []
+    clova_calls = 0
+    records = store.verifications(doc_type, limit)
+    started = time.perf_counter()
+    try:
+        for rec in records:
+            try:
+                data, ext = store.image(rec["image_sha256"])
+            except KeyError:
+                # 해시만 기록된 검증 (OCR_RECORD_IMAGES 미설정, bulk_verify --ocr-cache): 재생할 입력 이미지가 없음
+                errors.append({"id": rec["id"], "doc_type": rec["doc_type"], "error": "입력 이미지 미저장 (해시만 기록)"})
+                continue
+            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=ext)
+            with tmp as f:
+                f.write(data)
+            token = _session.set(_Session(rec["id"], store.calls_for(rec["id"])))
+            t0 = time.perf_counter()
+            try:
+                with collect() as st:
+                    result = validators[rec["doc_type"]](tmp.name)
+            except Exception as e:
+                errors.append({"id": rec["id"], "doc_type": rec["doc_type"], "error": repr(e)})
+                continue
+            finally:
+                _session.reset(token)
+                if os.path.exists(tmp.name):
+                    os.unlink(tmp.name)
+            clova_calls += st.clova_calls
+            st.durations["total"] = time.perf_counter() - t0
+            for name, ms in st.as_ms().items():
+                stage_samples.setdefault(name, []).append(ms)
+            fields = result.get("fields") or {}
+            if bool(result.get("valid")) != rec["valid"] or fields != rec["fields"]:
+                changes.append({
+                    "id": rec["id"], "doc_type": rec["doc_type"],
+                    "valid": [rec["valid"], bool(result.get("valid"))],
+                    "fields": {
+                        k: [rec["fields"].get(k, ""), fields.get(k, "")]
+                        for k in sorted(set(rec["fields"]) | set(fields))
+                        if rec["fields"].get(k, "") != fields.get(k, "")
+                    },
+                })
+    finally:
+        clova_ocr.replayer = prev
+        if prev_visualize is None:
+            os.environ.pop("OCR_VISUALIZE", None)
+        else:
+            os.environ["OCR_VISUALIZE"] = prev_visualize
+    elapsed = time.perf_counter() - started
+
+    done = len(records) - len(errors)
+    return {
+        "verifications": len(records),
+        "replayed": done,
+        "elapsed_sec": round(elapsed, 3),
+        "throughput_per_sec": round(done / elapsed, 2) if elapsed > 0 else 0.0,
+        "clova_calls": clova_calls,
+        "lookup": dict(source.stats),
+        "stage_ms": {
+            name: {"mean": round(sum(v) / len(v), 2), "p95": round(_percentile(v, 0.95), 2)}
+            for name, v in sorted(stage_samples.items())
+        },
+        "changes": changes,
+        "errors": errors,
+    }
@@ -0,0 +1,205 @@
+# services/profiling.py
+"""
+요청 단위 프로파일링 / 메모리 추적 (기본 비활성, 비활성 시 오버헤드 없음).
+
+- 프로파일 대상 선택: X-Profile-Token 헤더 == OCR_INTERNAL_TOKEN 이거나
+  OCR_PROFILE_SAMPLE_RATE(0~1) 확률 샘플링
+- OCR_PROFILE_MODE=cprofile → .pstats (snakeviz / pstats 로 열람)
+  OCR_PROFILE_MODE=sample   → .folded (flamegraph.pl / speedscope 호환 스택 샘플)
+- 결과 파일은 OCR_PROFILE_DIR 에 저장, OCR_PROFILE_MAX_FILES 개를 넘으면 오래된 것부터 삭제
+- tracemalloc 스냅샷/비교는 routes/admin_route.py 에서 노출
+"""
+import cProfile
+import functools
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from services import event_log
+
+OCR_INTERNAL_TOKEN = os.getenv("OCR_INTERNAL_TOKEN", "")
+PROFILE_DIR = os.getenv("OCR_PROFILE_DIR", os.path.join("/tmp", "pillchat-profiles"))
+PROFILE_SAMPLE_RATE = float(os.getenv("OCR_PROFILE_SAMPLE_RATE", "0"))
+PROFILE_MODE = os.getenv("OCR_PROFILE_MODE", "cprofile")
+# 보관할 최대 프로파일 파일 수 (0 이하면 무제한)
+PROFILE_MAX_FILES = int(os.getenv("OCR_PROFILE_MAX_FILES", "200"))
+# sample 모드 스택 수집 주기(초)
+SAMPLE_INTERVAL_SEC = float(os.getenv("OCR_PROFILE_SAMPLE_INTERVAL", "0.005"))
+
+# ------------------------
+# 요청 프로파일링
+# ------------------------
+def should_profile(profile_token: Optional[str]) -> bool:
+    """인증된 헤더 또는 샘플링 확률에 해당하면 True."""
+    if profile_token and OCR_INTERNAL_TOKEN and hmac.compare_digest(profile_token, OCR_INTERNAL_TOKEN):
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+def maybe_profiled(fn: Callable, label: str, profile_token: Optional[str]) -> Callable:
+    """프로파일 대상이면 fn 을 감싼 함수를, 아니면 fn 그대로 반환."""
+    if not should_profile(profile_token):
+        return fn
+    return profiled(fn, label)
+
+def _profile_path(label: str, ext: str) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}_{label}_{uuid.uuid4().hex[:8]}{ext}"
+    return os.path.join(PROFILE_DIR, name)
+
+def profiled(fn: Callable, label: str, mode: Optional[str] = None) -> Callable:
+    """
+    fn 실행을 프로파일해 PROFILE_DIR 에 저장하는 래퍼.
+    래퍼를 실행하는 스레드(스레드풀 워커)를 대상으로 한다.
+    """
+    mode = mode or PROFILE_MODE
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if mode == "sample":
+            sampler = StackSampler(threading.get_ident(), SAMPLE_INTERVAL_SEC)
+            sampler.start()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                sampler.stop()
+                _save(lambda p: sampler.dump(p), label, ".folded")
+        prof = cProfile.Profile()
+        try:
+            return prof.runcall(fn, *args, **kwargs)
+        finally:
+            _save(prof.dump_stats, label, ".pstats")
+    return wrapper
+
+def _save(dump_fn: Callable[[str], None], label: str, ext: str) -> None:
+    # 프로파일 저장 실패가 요청 실패로 이어지지 않도록
+    try:
+        dump_fn(_profile_path(label, ext))
+        _prune_profiles(PROFILE_MAX_FILES)
+    except Exception as e:
+        event_log.warn("profile_save_failed", "프로파일 저장 실패", label=label, error=str(e))
+
+def _prune_profiles(max_files: int) -> None:
+    """PROFILE_DIR 파일이 max_files 개를 넘으면 오래된 것부터 삭제."""
+    if max_files <= 0:
+        return
+    entries = sorted((e for e in os.scandir(PROFILE_DIR) if e.is_file()), key=lambda e: e.stat().st_mtime)
+    for e in entries[:max(0, len(entries) - max_files)]:
+        try:
+            os.unlink(e.path)
+        except FileNotFoundError:
+            pass  # 다른 워커가 먼저 삭제
+
+class StackSampler:
+    """
+    대상 스레드의 콜스택을 주기적으로 수집하는 샘플링 프로파일러.
+    dump() 는 'a;b;c <count>' 형식(folded stacks)으로 저장.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL_SEC):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ocr-stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, n in self.samples.most_common():
+                f.write(f"{stack} {n}\n")
+
+def list_profiles(limit: int = 50) -> List[Dict]:
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    entries = sorted(os.scandir(PROFILE_DIR), key=lambda e: e.stat().st_mtime, reverse=True)
+    return [{"file": e.name, "bytes": e.stat().st_size} for e in entries[:limit] if e.is_file()]
+
+# ------------------------
+# tracemalloc (PIL 메모리 증가 추적)
+# ------------------------
+_baseline: Optional[tracemalloc.Snapshot] = None
+_baseline_lock = threading.Lock()
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+
+def _fmt_stat(stat) -> Dict:
+    frame = stat.traceback[0]
+    out = {"location": f"{frame.filename}:{frame.lineno}", "size_kb": round(stat.size / 1024, 1), "count": stat.count}
+    if hasattr(stat, "size_diff"):
+        out["size_diff_kb"] = round(stat.size_diff / 1024, 1)
+        out["count_diff"] = stat.count_diff
+    return out
+
+def tracemalloc_status() -> Dict:
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "tracing": True,
+        "current_kb": round(current / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "has_baseline": _baseline is not None,
+    }
+
+def tracemalloc_start(nframes: int = 10) -> Dict:
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(nframes)
+    return tracemalloc_status()
+
+def tracemalloc_stop() -> Dict:
+    global _baseline
+    with _baseline_lock:
+        _baseline = None
+    tracemalloc.stop()
+    return tracemalloc_status()
+
+def tracemalloc_snapshot(limit: int = 20, key_type: str = "lineno") -> Dict:
+    """현재 할당 상위 limit 개 + 이후 diff 기준(baseline)으로 저장."""
+    global _baseline
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc 이 시작되지 않았습니다.")
+    snap = _take_snapshot()
+    with _baseline_lock:
+        _baseline = snap
+    return {**tracemalloc_status(), "top": [_fmt_stat(s) for s in snap.statistics(key_type)[:limit]]}
+
+def tracemalloc_diff(limit: int = 20, key_type: str = "lineno") -> Dict:
+    """baseline 이후 증가량 상위 limit 개."""
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc 이 시작되지 않았습니다.")
+    with _baseline_lock:
+        baseline = _baseline
+    if baseline is None:
+        raise RuntimeError("기준 스냅샷이 없습니다. 먼저 snapshot 을 호출하세요.")
+    stats = _take_snapshot().compare_to(baseline, key_type)
+    return {**tracemalloc_status(), "diff": [_fmt_stat(s) for s in stats[:limit]]}
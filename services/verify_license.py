@@ -1,16 +1,21 @@
 import os
 import re
-from typing import Dict, List
+from functools import partial
+from typing import Dict, List, Optional
 from services.common_ocr import (
-    clova_ocr, visualize_ocr_result, visualize_save_path,
+    clova_ocr, visualize_enabled, visualize_ocr_result, visualize_save_path,
     LICENSE_REQUIRED_KWS, LICENSE_NICE_KWS, LICENSE_NO_PATTERNS,
-    normalize_kor_date, collapse_spaced_hangul,
+    normalize_kor_date, collapse_spaced_hangul, matched_keywords,
 )
+from services.deadline import Deadline
 from services.image_utils import ensure_upright_for_license
+from services.layout_templates import read_fields, template_key
+from services.stages import stage
 
 BLOCKLIST = {"보건복지부", "면허증", "약사법", "장관", "MINISTRY", "HEALTH", "WELFARE"}
 BLOCKLIST_SUBSTRINGS = {"보건복지", "보건", "복지"} 
 NAME_TRAILING_NOISE = {"명", "성"}
+CONF_MIN = 0.70
 
 def _is_blocked(token: str) -> bool:
     if token in BLOCKLIST:
@@ -121,33 +126,45 @@ def _extract_license_fields(text: str) -> Dict[str, str]:
 
     return out
 
-def validate_license_document(image_path: str) -> Dict:
-    """
-    routes/ocr_route.py 가 import 하는 공개 함수.
-    """
-    # 1) 먼저 방향 보정 (0/±90 중 최적 선택)
-    upright_path = ensure_upright_for_license(image_path, clova_ocr.ocr_lines)
+def _parse_name(text: str) -> str:
+    cands = _pick_name_candidates(text)
+    name = clean_person_name(cands[0]) if cands else ""
+    return "" if _is_blocked(name) else name
 
-    # 2) 보정된 경로로 OCR 실행
-    result = clova_ocr.ocr(upright_path)
-    try:
-        visualize_ocr_result(
-            upright_path,
-            result,
-            save_path=visualize_save_path(upright_path, "clova_license_ocr"),
-        )
-    except Exception:
-        pass
+def _parse_license_number(text: str) -> str:
+    for pat in LICENSE_NO_PATTERNS:
+        m = re.search(pat, text)
+        if m:
+            return m.group(1)
+    return ""
+
+# 레이아웃 템플릿 영역 텍스트 → 필드 값 (빈 문자열이면 휴리스틱으로)
+FIELD_PARSERS = {
+    "name": _parse_name,
+    "licenseNumber": _parse_license_number,
+    "issueDate": normalize_kor_date,
+}
 
+def license_result_from_ocr(result: List[List]) -> Dict:
+    """
+    면허증 텍스트 규칙만 적용 (OCR 결과 → 검증 결과). Clova 호출 없음.
+    scripts/bulk_verify.py --reuse-ocr 가 캐시된 OCR 결과에 직접 사용.
+    """
     # 3) 텍스트 결합
-    lines: List[str] = [b[1][0] for b in result[0] if float(b[1][1]) >= 0.70]
+    boxes = [b for b in result[0] if float(b[1][1]) >= CONF_MIN]
+    lines: List[str] = [b[1][0] for b in boxes]
     full_text = " ".join(lines)
 
     # 4) 키워드/필드 추출
-    has_required_keywords = all(k in full_text for k in LICENSE_REQUIRED_KWS)
-    keyword_score = sum(k in full_text for k in LICENSE_NICE_KWS)
-
-    fields = _extract_license_fields(full_text)
+    # 정확 일치 + OCR 노이즈 근사 일치
+    found_kws = {k for k in LICENSE_REQUIRED_KWS | LICENSE_NICE_KWS if k in full_text}
+    found_kws |= matched_keywords(full_text)
+    has_required_keywords = LICENSE_REQUIRED_KWS <= found_kws
+    keyword_score = len(LICENSE_NICE_KWS & found_kws)
+
+    # 면허증 양식이 확인되면 레이아웃 템플릿 영역을 먼저 읽고, 못 읽은 필드만 휴리스틱
+    found, layout = read_fields(template_key("license"), boxes, FIELD_PARSERS) if has_required_keywords else ({}, "none")
+    fields = found if layout == "hit" else {**_extract_license_fields(full_text), **found}
     has_required_fields = all([
         fields.get("name"),
         fields.get("licenseNumber"),
@@ -155,7 +172,7 @@ def validate_license_document(image_path: str) -> Dict:
     ])
 
     valid = bool(has_required_keywords and has_required_fields)
-    out = {
+    return {
         "valid": valid,
         "documentType": "license",
         "text": full_text,
@@ -163,14 +180,43 @@ def validate_license_document(image_path: str) -> Dict:
         "has_required_keywords": has_required_keywords,
         "has_required_fields": has_required_fields,
         "keyword_score": keyword_score,
+        "layout_template": layout,
         "ocr_engine": "clova",
     }
 
-    # 5) 임시 보정 이미지 정리
+def validate_license_document(image_path: str, deadline: Optional[Deadline] = None) -> Dict:
+    """
+    routes/ocr_route.py 가 import 하는 공개 함수.
+    deadline 만료/취소 시 남은 Clova 호출 없이 DeadlineExceeded 로 중단.
+    """
+    # 1) 먼저 방향 보정 (0/±90 중 최적 선택)
+    with stage("orientation"):
+        upright_path = ensure_upright_for_license(
+            image_path, partial(clova_ocr.ocr_lines, deadline=deadline), deadline=deadline,
+        )
     try:
-        if upright_path != image_path and os.path.exists(upright_path):
-            os.unlink(upright_path)
-    except Exception:
-        pass
-
-    return out
\ No newline at end of file
+        # 2) 보정된 경로로 OCR 실행
+        with stage("ocr"):
+            result = clova_ocr.ocr(upright_path, deadline=deadline)
+        if visualize_enabled() and (deadline is None or not deadline.expired):
+            with stage("visualize"):
+                try:
+                    visualize_ocr_result(
+                        upright_path,
+                        result,
+                        save_path=visualize_save_path(upright_path, "clova_license_ocr"),
+                    )
+                except Exception:
+                    pass
+
+        with stage("extract"):
+            return license_result_from_ocr(result)
+    finally:
+        # 5) 임시 보정 이미지와 그 시각화 파일 정리 (중단된 경우 포함)
+        if upright_path != image_path:
+            for p in (upright_path, visualize_save_path(upright_path, "clova_license_ocr")):
+                try:
+                    if os.path.exists(p):
+                        os.unlink(p)
+                except Exception:
+                    pass
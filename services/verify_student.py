@@ -1,37 +1,68 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
+from services.deadline import Deadline
 from services.image_utils import is_card_like
+from services.layout_templates import read_fields, template_key
+from services.stages import stage
 from services.common_ocr import (
-    clova_ocr, visualize_ocr_result, visualize_save_path,
+    clova_ocr, visualize_enabled, visualize_ocr_result, visualize_save_path,
     correct_typos, is_likely_student_card, has_pharmacy_major,
-    merge_lines_by_y, extract_name_heuristic,
+    merge_lines_by_y, extract_name_heuristic, extract_name_from_region,
     extract_student_id_regex, extract_university_regex,extract_department_regex,
+    extract_department_from_region,
 )
 
-def extract_fields_simple(lines: List[str]) -> Dict:
+CONF_MIN = 0.8
+
+# 레이아웃 템플릿 영역 텍스트 → 필드 값 (빈 문자열이면 휴리스틱으로)
+FIELD_PARSERS = {
+    "name": extract_name_from_region,
+    "studentId": extract_student_id_regex,
+    "department": extract_department_from_region,
+}
+
+def extract_fields(lines: List[str], boxes: Sequence) -> Tuple[Dict, str]:
+    """
+    대학을 먼저 찾고, 그 대학의 레이아웃 템플릿이 있으면 필드 영역을 바로 읽음.
+    템플릿에서 못 읽은 필드만 기존 휴리스틱으로 채운다.
+    반환: (fields, 템플릿 상태 hit/partial/miss/none)
+    """
     full_text = " ".join(lines)
+    university = extract_university_regex(full_text)
+    found, status = read_fields(template_key("student", university), boxes, FIELD_PARSERS)
     return {
-        "name": extract_name_heuristic(full_text, lines),
-        "studentId": extract_student_id_regex(full_text),
-        "university": extract_university_regex(full_text),
-        "department": extract_department_regex(full_text),
-    }
+        "name": found.get("name") or extract_name_heuristic(full_text, lines),
+        "studentId": found.get("studentId") or extract_student_id_regex(full_text),
+        "university": university,
+        "department": found.get("department") or extract_department_regex(full_text),
+    }, status
+
+def validate_student_card(image_path: str, deadline: Optional[Deadline] = None) -> Dict:
+    with stage("ocr"):
+        result = clova_ocr.ocr(image_path, deadline=deadline)
+    if visualize_enabled() and (deadline is None or not deadline.expired):
+        with stage("visualize"):
+            try:
+                visualize_ocr_result(image_path, result, save_path=visualize_save_path(image_path, "clova_ocr"))
+            except Exception:
+                pass
 
-def validate_student_card(image_path: str) -> Dict:
-    result = clova_ocr.ocr(image_path)
-    try:
-        visualize_ocr_result(image_path, result, save_path=visualize_save_path(image_path, "clova_ocr"))
-    except Exception:
-        pass
+    with stage("extract"):
+        return student_result_from_ocr(result, image_path)
 
+def student_result_from_ocr(result: List[List], image_path: str) -> Dict:
+    """
+    학생증 텍스트 규칙만 적용 (OCR 결과 → 검증 결과). Clova 호출 없음.
+    카드 형태 판단에 원본 이미지 크기가 필요해 image_path 를 받는다.
+    """
     sorted_result = sorted(result[0], key=lambda b: b[0][0][1])
-    filtered = [b for b in sorted_result if float(b[1][1]) >= 0.8]
+    filtered = [b for b in sorted_result if float(b[1][1]) >= CONF_MIN]
     lines = merge_lines_by_y(filtered)
     full_text = correct_typos(" ".join(lines))
 
     is_student = is_likely_student_card(full_text)
     has_pharm = has_pharmacy_major(full_text) or ("약학" in full_text)
     looks_like = is_card_like(image_path, result)
-    fields = extract_fields_simple(lines)
+    fields, layout = extract_fields(lines, filtered)
 
     valid = bool(is_student and has_pharm and looks_like)
     return {
@@ -43,6 +74,6 @@ def validate_student_card(image_path: str) -> Dict:
         "text": full_text,
         "fields": fields,
         "text_length": len(full_text),
+        "layout_template": layout,
         "ocr_engine": "clova",
     }
-    
\ No newline at end of file
@@ -1,7 +1,14 @@
+import os
 from paddleocr import draw_ocr
 from PIL import Image
+from services.event_log import emit
+
+def visualize_enabled() -> bool:
+    return os.getenv("OCR_VISUALIZE", "1") != "0"
 
 def visualize_ocr_result(image_path: str, ocr_result, save_path: str = "ocr_result.jpg"):
+    if not visualize_enabled():
+        return
     image = Image.open(image_path).convert("RGB")
     boxes = [line[0] for line in ocr_result[0]]
     txts = [line[1][0] for line in ocr_result[0]]
@@ -10,4 +17,4 @@ def visualize_ocr_result(image_path: str, ocr_result, save_path: str = "ocr_resu
     # Image.fromarray(annotated).save(save_path)
     result_image = Image.fromarray(annotated)
     result_image.save(save_path)
-    print(f"[🖼️ OCR 시각화 저장 완료] {save_path}")
+    emit("visualization_saved", path=save_path)
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from services import clova_ocr as clova_module
+from services.clova_ocr import ClovaOCR
+from services.deadline import Deadline, DeadlineExceeded, cancel_stats
+
+
+class _Response:
+    status_code = 200
+
+    def json(self):
+        return {"images": [{"fields": []}]}
+
+
+def _client():
+    return ClovaOCR("http://test.invalid", "test", max_retries=0)
+
+
+def test_cancel_abandons_in_flight_call(tmp_path, monkeypatch):
+    path = tmp_path / "card.jpg"
+    path.write_bytes(b"image")
+    release = threading.Event()
+
+    def slow_post(*args, **kwargs):
+        release.wait(5)
+        return _Response()
+
+    monkeypatch.setattr(clova_module.requests, "post", slow_post)
+    d = Deadline(30)
+    threading.Timer(0.1, d.cancel, args=("client disconnected",)).start()
+    before = cancel_stats()["clova_calls_abandoned"]
+    t0 = time.perf_counter()
+    with pytest.raises(DeadlineExceeded, match="client disconnected"):
+        _client().ocr(str(path), deadline=d)
+    release.set()
+    assert time.perf_counter() - t0 < 1.0
+    assert cancel_stats()["clova_calls_abandoned"] - before == 1
+
+
+def test_call_with_deadline_returns_response_and_errors(tmp_path, monkeypatch):
+    path = tmp_path / "card.jpg"
+    path.write_bytes(b"image")
+    monkeypatch.setattr(clova_module.requests, "post", lambda *a, **k: _Response())
+    assert _client().ocr(str(path), deadline=Deadline(30)) == [[]]
+
+    def refused(*args, **kwargs):
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(clova_module.requests, "post", refused)
+    with pytest.raises(RuntimeError, match="네트워크 오류"):
+        _client().ocr(str(path), deadline=Deadline(30))
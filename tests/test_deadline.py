@@ -0,0 +1,97 @@
+import os
+
+# Clova 호출 없음. ClovaOCR 생성에 설정값만 필요
+os.environ.setdefault("CLOVA_OCR_URL", "http://test.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "test")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+import pytest  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from services.deadline import Deadline, DeadlineExceeded, cancel_stats  # noqa: E402
+from services.image_utils import ensure_upright_for_license  # noqa: E402
+from services import verify_license  # noqa: E402
+
+
+@pytest.mark.parametrize("header", ["0", "-1", "-5000"])
+def test_exhausted_header_budget_is_already_expired(header):
+    d = Deadline.from_header(header, 30000)
+    assert d.expired
+    with pytest.raises(DeadlineExceeded):
+        d.check("clova")
+
+
+def test_positive_header_sets_remaining_time():
+    d = Deadline.from_header("5000", 30000)
+    assert not d.expired
+    assert 4.0 < d.remaining() <= 5.0
+
+
+@pytest.mark.parametrize("header", [None, "", "abc"])
+def test_missing_or_invalid_header_uses_default(header):
+    d = Deadline.from_header(header, 30000)
+    assert 29.0 < d.remaining() <= 30.0
+
+
+def test_non_positive_default_means_no_deadline():
+    d = Deadline.from_header(None, 0)
+    assert d.remaining() is None
+    assert not d.expired
+    d.check("clova")
+
+
+def test_cancel_expires_deadline():
+    d = Deadline.from_header(None, 0)
+    d.cancel("client disconnected")
+    with pytest.raises(DeadlineExceeded, match="client disconnected"):
+        d.check("orientation")
+
+
+def _avoided():
+    return cancel_stats()["clova_calls_avoided"]
+
+
+@pytest.mark.parametrize("cancel_at", [1, 2, 3])
+def test_avoided_calls_when_deadline_hits_inside_probe(tmp_path, cancel_at):
+    path = str(tmp_path / "license.jpg")
+    Image.new("RGB", (600, 400), "white").save(path)
+    d = Deadline.from_header(None, 0)
+    calls = []
+
+    def ocr_lines(p, conf_min=0.7):
+        # ClovaOCR._call_api 처럼 호출 직전에 확인 (이 호출 1건 집계)
+        calls.append(p)
+        if len(calls) == cancel_at:
+            d.cancel("client disconnected")
+        d.check("clova", pending_calls=1)
+        return []
+
+    before = _avoided()
+    with pytest.raises(DeadlineExceeded):
+        ensure_upright_for_license(path, ocr_lines, deadline=d)
+    # 방향 후보 3개 + 최종 OCR 1회 중 보내지 않은 호출 = 취소된 후보부터 끝까지
+    assert _avoided() - before == 3 - cancel_at + 2
+
+
+def test_license_validation_removes_upright_and_visualization(tmp_path, monkeypatch):
+    import tempfile
+
+    upload = tmp_path / "upload"
+    upload.mkdir()
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(work))
+    monkeypatch.setenv("OCR_VISUALIZE", "1")
+    path = str(upload / "license.jpg")
+    Image.new("RGB", (600, 400), "white").save(path)
+
+    monkeypatch.setattr(verify_license.clova_ocr, "ocr_lines", lambda p, conf_min=0.7, deadline=None: [])
+    monkeypatch.setattr(verify_license.clova_ocr, "ocr", lambda p, deadline=None: [[]])
+
+    def fake_visualize(image_path, result, save_path):
+        open(save_path, "wb").close()
+
+    monkeypatch.setattr(verify_license, "visualize_ocr_result", fake_visualize)
+    verify_license.validate_license_document(path)
+    assert os.listdir(upload) == ["license.jpg"]
+    assert os.listdir(work) == []
@@ -0,0 +1,70 @@
+from services.fuzzy_match import (
+    FuzzyIndex, FuzzyMatch, bounded_levenshtein, max_distance, select_matches, to_jamo,
+)
+
+VOCAB = ["약학과", "약학대학", "약학", "의학과", "의학대학", "면허증", "보건복지부", "서울대학교"]
+INDEX = FuzzyIndex(VOCAB)
+
+
+def _terms(text):
+    return {(m.term, m.dist) for m in INDEX.find(text)}
+
+
+def test_to_jamo_decomposes_and_drops_spaces():
+    assert to_jamo("약학 과") == "ㅇㅑㄱㅎㅏㄱㄱㅘ"
+    assert to_jamo("ID Card") == "idcard"
+
+
+def test_max_distance_by_length():
+    assert max_distance(len(to_jamo("약학"))) == 0
+    assert max_distance(len(to_jamo("약학과"))) == 1
+    assert max_distance(len(to_jamo("보건복지부"))) == 2
+
+
+def test_bounded_levenshtein():
+    assert bounded_levenshtein(to_jamo("약학과"), to_jamo("약학괴"), 1) == 1
+    assert bounded_levenshtein(to_jamo("약학과"), to_jamo("의학과"), 1) == 2  # k 초과 → k + 1
+
+
+def test_find_exact_with_char_offsets():
+    text = "서울대학교 약학과"
+    matches = [m for m in INDEX.find(text) if m.term == "약학과"]
+    assert matches == [FuzzyMatch("약학과", 6, 9, 0)]
+    assert text[6:9] == "약학과"
+
+
+def test_find_one_jamo_noise():
+    assert ("약학과", 1) in _terms("약학괴")
+    assert ("면허증", 1) in _terms("먼허증")
+    assert ("보건복지부", 2) in _terms("보견복치부")
+
+
+def test_find_ignores_spaces_inside_term():
+    assert ("약학대학", 0) in _terms("약학 대학")
+
+
+def test_find_short_terms_exact_only():
+    # 약학(자모 6개)은 거리 0 만 허용 → 약한 은 매칭 안 됨
+    assert not any(t == "약학" for t, _ in _terms("약한"))
+
+
+def test_find_too_noisy_is_rejected():
+    assert not any(t == "면허증" for t, _ in _terms("면세점"))
+    assert INDEX.find("") == []
+
+
+def test_select_matches_prefers_more_matched_jamo():
+    # 약학(0) 보다 약학과(1) 가 일치 자모가 많음
+    selected = select_matches(INDEX.find("약학괴"))
+    assert [m.term for m in selected] == ["약학과"]
+
+
+def test_select_matches_prefers_closer_distractor():
+    selected = select_matches(INDEX.find("의학대학"))
+    assert [(m.term, m.dist) for m in selected] == [("의학대학", 0)]
+
+
+def test_select_matches_keeps_non_overlapping_in_text_order():
+    selected = select_matches(INDEX.find("면허증 보건복지부 약학대학"))
+    assert [m.term for m in selected] == ["면허증", "보건복지부", "약학대학"]
+    assert all(a.end <= b.start for a, b in zip(selected, selected[1:]))
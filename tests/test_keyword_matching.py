@@ -0,0 +1,88 @@
+import os
+
+# Clova 호출 없음. ClovaOCR 생성에 설정값만 필요
+os.environ.setdefault("CLOVA_OCR_URL", "http://test.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "test")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+import pytest  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from services.common_ocr import (  # noqa: E402
+    LICENSE_REQUIRED_KWS, correct_typos, extract_university_regex, has_pharmacy_major,
+    is_likely_student_card, matched_keywords,
+)
+from services.verify_student import student_result_from_ocr  # noqa: E402
+
+NON_PHARMACY_MAJORS = ["식품영양학과", "영양학과", "역학과", "양학과", "악학과"]
+
+
+@pytest.mark.parametrize("major", NON_PHARMACY_MAJORS)
+def test_non_pharmacy_major_is_not_pharmacy(major):
+    assert has_pharmacy_major(major) is False
+    assert has_pharmacy_major(f"생활과학대학 {major}") is False
+
+
+@pytest.mark.parametrize("major", NON_PHARMACY_MAJORS)
+def test_correct_typos_does_not_rewrite_other_majors(major):
+    assert correct_typos(major) == major
+    assert correct_typos(f"경기대학교 {major}") == f"경기대학교 {major}"
+
+
+@pytest.mark.parametrize("noisy", ["약학괴", "약확과", "약학대햑"])
+def test_noisy_pharmacy_keyword_is_recognized(noisy):
+    assert has_pharmacy_major(noisy) is True
+
+
+def test_correct_typos_restores_canonical_name():
+    assert correct_typos("서울대학교 약학대학 약학괴") == "서울대학교 약학대학 약학과"
+
+
+def test_is_likely_student_card():
+    assert is_likely_student_card("경기대학교 학생증")
+    assert is_likely_student_card("학샘증 홍길동")
+    assert not is_likely_student_card("주민등록증 홍길동")
+
+
+def test_license_keywords_with_noise():
+    assert LICENSE_REQUIRED_KWS <= matched_keywords("약사 먼허증 보견복지부 장관")
+    assert not LICENSE_REQUIRED_KWS <= matched_keywords("운전면허 보험증")
+
+
+def test_medicine_is_not_pharmacy():
+    assert has_pharmacy_major("의학대학 의학과") is False
+
+
+@pytest.mark.parametrize("university", ["경기대학교", "한성대학교", "건국대학교", "광운대학교", "인하대학교"])
+def test_unlisted_university_is_not_replaced(university):
+    assert extract_university_regex(f"{university} 학생증 성명 홍길동") == university
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("서울대학교 학생증", "서울대학교"),
+    ("학생증서울대학교 약학대학", "서울대학교"),
+    ("대구가톨릭대학교 약학대학", "대구가톨릭대학교"),
+    ("학생증대구가톨릭대학교", "대구가톨릭대학교"),
+    ("부산가톨릭대학교 학생증", "부산가톨릭대학교"),
+    ("가톨릭대학교 약학대학", "가톨릭대학교"),
+    ("서울대학쿄 학생증", "서울대학교"),
+    ("KOREA UNIVERSITY", "KOREA UNIVERSITY"),
+    ("학생증 홍길동", ""),
+])
+def test_extract_university(text, expected):
+    assert extract_university_regex(text) == expected
+
+
+def _box(text, y):
+    return [[[0, y], [200, y], [200, y + 20], [0, y + 20]], (text, 0.99)]
+
+
+def test_food_nutrition_student_card_is_invalid(tmp_path):
+    image_path = str(tmp_path / "card.jpg")
+    Image.new("RGB", (856, 540), "white").save(image_path)
+    lines = ["경기대학교 학생증", "생활과학대학 식품영양학과", "성명 홍길동", "학번 2021123456"]
+    result = [[_box(t, 40 * i) for i, t in enumerate(lines)]]
+
+    out = student_result_from_ocr(result, image_path)
+    assert out["has_pharmacy"] is False
+    assert out["valid"] is False
@@ -0,0 +1,79 @@
+import os
+
+# 네트워크를 쓰지 않지만 ClovaOCR 생성에 설정값이 필요
+os.environ.setdefault("CLOVA_OCR_URL", "http://test.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "test")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+from scripts.build_layout_templates import _agreed_region  # noqa: E402
+from services.layout_templates import read_fields  # noqa: E402
+from services.verify_student import FIELD_PARSERS  # noqa: E402
+
+TEMPLATES = {
+    "student:서울대학교": {
+        "samples": 20,
+        "fields": {
+            "name": [0.4, 0.3, 1.0, 0.45],
+            "studentId": [0.4, 0.5, 1.0, 0.65],
+            "department": [0.4, 0.7, 1.0, 0.85],
+        },
+    },
+}
+
+
+def _box(text, x, y):
+    return [[[x, y], [x + 100, y], [x + 100, y + 20], [x, y + 20]], (text, 0.99)]
+
+
+def _card(name="홍길동", student_id="2021123456", department="약학과"):
+    return [
+        _box("서울대학교", 0, 0),
+        _box("성명", 0, 80), _box(name, 200, 80),
+        _box("학번", 0, 130), _box(student_id, 200, 130),
+        _box("소속", 0, 180), _box(department, 200, 180),
+        _box("총장", 0, 240),
+    ]
+
+
+def test_read_fields_hit():
+    found, status = read_fields("student:서울대학교", _card(), FIELD_PARSERS, TEMPLATES)
+    assert status == "hit"
+    assert found == {"name": "홍길동", "studentId": "2021123456", "department": "약학과"}
+
+
+def test_read_fields_partial():
+    found, status = read_fields("student:서울대학교", _card(student_id="학번없음"), FIELD_PARSERS, TEMPLATES)
+    assert status == "partial"
+    assert "studentId" not in found and found["name"] == "홍길동"
+
+
+def test_read_fields_miss():
+    boxes = [_box("서울대학교", 0, 0), _box("홍길동 2021123456 약학과", 0, 240)]
+    assert read_fields("student:서울대학교", boxes, FIELD_PARSERS, TEMPLATES) == ({}, "miss")
+
+
+def test_read_fields_without_template():
+    assert read_fields("student:연세대학교", _card(), FIELD_PARSERS, TEMPLATES) == ({}, "none")
+
+
+def _rect(x0, y, w=0.1):
+    return (x0, y, x0 + w, y + 0.04)
+
+
+def test_agreed_region_accepts_tight_cluster_of_varying_width():
+    rects = [_rect(0.40 + 0.005 * i, 0.30, w=0.08 + 0.02 * (i % 3)) for i in range(10)]
+    region = _agreed_region(rects, samples=10, min_samples=5, min_agreement=0.8, margin=0.0)
+    assert region is not None
+    assert region[0] == 0.4 and region[1] == 0.3
+
+
+def test_agreed_region_rejects_scattered_positions():
+    # 휴리스틱 오답이 섞여 절반만 같은 위치 → 영역을 만들지 않음
+    rects = [_rect(0.40, 0.30)] * 5 + [_rect(0.1 * i, 0.6 + 0.03 * i) for i in range(5)]
+    assert _agreed_region(rects, samples=10, min_samples=5, min_agreement=0.8, margin=0.0) is None
+
+
+def test_agreed_region_counts_samples_where_value_was_not_found():
+    rects = [_rect(0.40, 0.30)] * 6
+    assert _agreed_region(rects, samples=20, min_samples=5, min_agreement=0.8, margin=0.0) is None
+    assert _agreed_region(rects, samples=6, min_samples=5, min_agreement=0.8, margin=0.0) is not None
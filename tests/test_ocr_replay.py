@@ -0,0 +1,85 @@
+import os
+
+# 재생은 네트워크를 쓰지 않지만 ClovaOCR 생성에 설정값이 필요
+os.environ.setdefault("CLOVA_OCR_URL", "http://test.invalid")
+os.environ.setdefault("CLOVA_SECRET_KEY", "test")
+os.environ.pop("OCR_RECORD_PATH", None)
+
+from services.ocr_replay import ClovaStore, replay  # noqa: E402
+
+
+def test_replay_reports_hash_only_records_as_errors(tmp_path):
+    store = ClovaStore(str(tmp_path / "cache.sqlite"))
+    vid = store.start_verification("student", "0" * 64)
+    store.finish_verification(vid, {"valid": True, "fields": {}}, {})
+
+    report = replay(store)
+    store.close()
+    assert report["replayed"] == 0
+    assert [e["id"] for e in report["errors"]] == [vid]
+
+
+def _field(text, y):
+    verts = [{"x": 0, "y": y}, {"x": 200, "y": y}, {"x": 200, "y": y + 20}, {"x": 0, "y": y + 20}]
+    return {"inferText": text, "inferConfidence": 0.99, "boundingPoly": {"vertices": verts}}
+
+
+def test_replay_writes_no_visualization(tmp_path, monkeypatch):
+    import io
+    import tempfile
+    from PIL import Image
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.delenv("OCR_VISUALIZE", raising=False)
+    buf = io.BytesIO()
+    Image.new("RGB", (856, 540), "white").save(buf, format="JPEG")
+    store = ClovaStore(str(tmp_path / "record.sqlite"))
+    sha = store.put_image(buf.getvalue(), ".jpg")
+    vid = store.start_verification("student", sha)
+    lines = ["서울대학교 학생증", "약학대학 약학과", "성명 홍길동", "학번 2021123456"]
+    response = {"images": [{"fields": [_field(t, 40 * i) for i, t in enumerate(lines)]}]}
+    store.add_call(vid, 0, sha, {"lang": "ko"}, response, 0.1)
+    store.finish_verification(vid, {"valid": True, "fields": {}}, {})
+
+    report = replay(store)
+    store.close()
+    assert report["errors"] == []
+    assert "visualize" not in report["stage_ms"]
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".jpg")]
+    assert "OCR_VISUALIZE" not in os.environ
+
+
+def test_recorder_keeps_only_image_hash_by_default(tmp_path):
+    import pytest
+    from services.ocr_replay import ClovaRecorder, file_sha256
+
+    path = str(tmp_path / "card.jpg")
+    with open(path, "wb") as f:
+        f.write(b"id card bytes")
+    store = ClovaStore(str(tmp_path / "record.sqlite"))
+    ClovaRecorder(store).wrap(lambda p: {"valid": True, "fields": {}}, "student")(path)
+
+    [rec] = store.verifications()
+    assert rec["image_sha256"] == file_sha256(path)
+    with pytest.raises(KeyError):
+        store.image(rec["image_sha256"])
+    store.close()
+
+
+def test_recording_failure_is_warned_and_verification_succeeds(tmp_path, monkeypatch, capsys):
+    import sqlite3
+    from services.ocr_replay import ClovaRecorder
+
+    path = str(tmp_path / "card.jpg")
+    with open(path, "wb") as f:
+        f.write(b"id card bytes")
+    store = ClovaStore(str(tmp_path / "record.sqlite"))
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "start_verification", locked)
+    result = ClovaRecorder(store).wrap(lambda p: {"valid": True}, "student")(path)
+    store.close()
+    assert result == {"valid": True}
+    assert "Clova 응답 기록 실패" in capsys.readouterr().out
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+from PIL import Image, ImageDraw, ImageStat
+
+from services.image_utils import _best_rotation, _license_score
+
+LICENSE_LINES = ["약사 면허증", "보건복지부 장관", "약사법 제3조"]
+
+
+def _card() -> Image.Image:
+    """정방향이면 왼쪽 위에 검은 표식이 오는 가로형 카드."""
+    img = Image.new("RGB", (1600, 1000), "white")
+    ImageDraw.Draw(img).rectangle((0, 0, 400, 250), fill="black")
+    return img
+
+
+def _upright(img: Image.Image) -> bool:
+    w, h = img.size
+    if w <= h:
+        return False
+    corner = img.convert("L").crop((0, 0, w // 8, h // 8))
+    return ImageStat.Stat(corner).mean[0] < 64
+
+
+class FakeOCR:
+    """정방향 후보에서만 면허증 문구를 읽는 ocr_lines 대역. 받은 파일을 기록."""
+
+    def __init__(self, lines_fn=None):
+        self.calls = []
+        self.lines_fn = lines_fn
+
+    def __call__(self, path, conf_min=0.7):
+        with Image.open(path) as im:
+            self.calls.append({"path": path, "bytes": os.path.getsize(path), "mode": im.mode, "size": im.size})
+            if self.lines_fn is not None:
+                return self.lines_fn(im)
+            return LICENSE_LINES if _upright(im) else ["가나다"]
+
+
+@pytest.mark.parametrize("rot", [0, 90, 270])
+def test_probe_and_full_pick_same_angle(rot):
+    img = _card().rotate(rot, expand=True)
+    full, probe = FakeOCR(), FakeOCR()
+    full_angle = _best_rotation(img, full, _license_score, probe_long_side=0)
+    probe_angle = _best_rotation(img, probe, _license_score, probe_long_side=480)
+
+    assert full_angle == probe_angle
+    assert _upright(img.rotate(probe_angle, expand=True))
+    assert sum(c["bytes"] for c in probe.calls) < sum(c["bytes"] for c in full.calls)
+    assert all(c["mode"] == "L" and max(c["size"]) <= 480 for c in probe.calls)
+
+
+@pytest.mark.parametrize("probe_long_side", [0, 480])
+def test_tie_keeps_zero_degrees(probe_long_side):
+    for lines_fn in (lambda im: [], lambda im: ["가나다"]):
+        ocr = FakeOCR(lines_fn)
+        assert _best_rotation(_card(), ocr, _license_score, probe_long_side=probe_long_side) == 0
+        assert len(ocr.calls) == 3
+
+
+def test_failed_candidate_is_skipped():
+    def flaky(im):
+        if not _upright(im):
+            raise RuntimeError("Clova OCR API 실패[500]")
+        return LICENSE_LINES
+
+    img = _card().rotate(90, expand=True)
+    assert _upright(img.rotate(_best_rotation(img, FakeOCR(flaky), _license_score, 480), expand=True))
+
+
+@pytest.mark.parametrize("probe_long_side", [0, 480])
+def test_candidate_files_are_removed(probe_long_side):
+    ocr = FakeOCR()
+    _best_rotation(_card().rotate(90, expand=True), ocr, _license_score, probe_long_side=probe_long_side)
+    assert len(ocr.calls) == 3
+    assert not any(os.path.exists(c["path"]) for c in ocr.calls)
@@ -0,0 +1,18 @@
+import os
+
+from services import profiling
+
+
+def test_profile_dir_is_capped(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(profiling, "PROFILE_MAX_FILES", 3)
+    for i in range(5):
+        old = tmp_path / f"old{i}.pstats"
+        old.write_text("")
+        os.utime(old, (1000 + i, 1000 + i))
+
+    profiling.profiled(lambda: 42, "student")()
+    files = sorted(os.listdir(tmp_path))
+    assert len(files) == 3
+    assert "old3.pstats" in files and "old4.pstats" in files
+    assert not any(f.startswith(("old0", "old1", "old2")) for f in files)